@@ -15,12 +15,24 @@ Usage:
 """
 
 import asyncio
+import functools
+import hashlib
+import heapq
 import json
 import logging
+import mmap
 import os
+import pickle
+import re
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+from types import MappingProxyType
+from dataclasses import dataclass, field, fields
+from typing import NamedTuple, Optional
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -40,17 +52,286 @@ from mcp.types import (
 )
 import base64
 
+try:
+    import orjson  # Optional: faster index load/save
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64  # Optional: SIMD base64 for PDF resources
+except ImportError:
+    pybase64 = None
+
+try:
+    import zstandard  # Optional: zstd-compressed PDF resources
+except ImportError:
+    zstandard = None
+
+# Per-word weights for title, description, any topic and any term, in word blob order
+_WORD_WEIGHTS = (0.5, 0.3, 0.5, 0.5)
+
 logging.basicConfig(level=logging.INFO)
+# The log format never shows thread, process or task names, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False  # Python 3.12+; harmless before
 logger = logging.getLogger("standards-librarian")
 
 server = Server("standards-librarian")
 
 
+# =============================================================================
+# Caching
+# =============================================================================
+
+_MISSING = object()  # Cache sentinel, distinguishes a cached None from a miss
+
+
+class LRUCache:
+    """Small bounded mapping that evicts the least recently used entry."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+    
+    def get(self, key, default=None):
+        """Return the cached value for key (marking it recently used) or default."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def put(self, key, value):
+        """Cache a value, evicting the oldest entry if the cache is full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries."""
+        self._data.clear()
+
+
+# Bump when a pickled class changes shape in a way its field names don't show
+_CACHE_VERSION = 1
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    """Load the index cache, resolving this module's classes under whatever name wrote it.
+    
+    The server pickles its classes as __main__.* when run as a script and as
+    src.mcp_librarian.* when imported, so the writer's module name is mapped
+    to this module. Without a writer module (the header) no class is loaded.
+    """
+    
+    def __init__(self, file, writer_module: Optional[str] = None):
+        super().__init__(file)
+        self.writer_module = writer_module
+    
+    def find_class(self, module, name):
+        if self.writer_module is None:
+            raise pickle.UnpicklingError(f"unexpected class {module}.{name} in cache header")
+        if module == self.writer_module:
+            return getattr(sys.modules[__name__], name)
+        return super().find_class(module, name)
+
+
+# =============================================================================
+# Text Matching
+# =============================================================================
+
+class AhoCorasick:
+    """Multi-pattern substring matcher.
+    
+    Finds every indexed pattern that occurs in a text with a single pass over the
+    text, independent of how many patterns are indexed. The automaton is rebuilt
+    lazily after new patterns are added.
+    """
+    
+    def __init__(self):
+        self._goto: list[dict[str, int]] = [{}]
+        self._words: list[list[str]] = [[]]      # Patterns ending exactly at each node
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]        # Patterns ending at each node, incl. via failure links
+        self._built = True
+    
+    def add_word(self, word: str):
+        """Add a pattern to the automaton."""
+        node = 0
+        for ch in word:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._words.append([])
+            node = nxt
+        self._words[node].append(word)
+        self._built = False
+    
+    def _make_automaton(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        self._fail = [0] * len(self._goto)
+        self._out = [list(words) for words in self._words]
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+        self._built = True
+    
+    def iter(self, text: str):
+        """Yield (end_index, pattern) for every pattern occurrence in text."""
+        if not self._built:
+            self._make_automaton()
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for word in self._out[node]:
+                yield i, word
+
+
 # =============================================================================
 # Standards Index (simple JSON-based)
 # =============================================================================
 
-@dataclass
+def _join_fields(texts: list[str]) -> tuple[str, tuple]:
+    """Join lowercased fields by NUL for _phrase_hits, with each field's start offset."""
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    return "\x00".join(texts), tuple(starts)
+
+
+def _phrase_hits(blob: str, starts, query_lower: str):
+    """Yield the index of each field of a NUL-joined blob that contains the query."""
+    if not starts or "\x00" in query_lower:
+        return
+    pos = blob.find(query_lower)
+    while pos >= 0:
+        # Report the field containing this hit once, then resume at the next field
+        field_idx = bisect_right(starts, pos) - 1
+        yield field_idx
+        if field_idx + 1 == len(starts):
+            return
+        pos = blob.find(query_lower, starts[field_idx + 1])
+
+
+def _dot_prefixes(ref: str):
+    """Yield each prefix of a section reference that ends just before a '.'."""
+    pos = ref.find(".")
+    while pos >= 0:
+        yield ref[:pos]
+        pos = ref.find(".", pos + 1)
+
+
+class ItemIndex(NamedTuple):
+    """Inverted indexes over one kind of annex/table/figure entry of a standard."""
+    items: tuple                             # (entry ID, entry data) pairs, in index order
+    descs_blob: str                          # Lowercased descriptions joined by NUL
+    descs_starts: tuple                      # Start offset of each description in descs_blob
+    ref_items: dict[str, list[int]]          # Lowercased location / related section -> entries
+    ref_prefix_items: dict[str, list[int]]   # Dotted prefix of a reference ("8.7" of "8.7.3") -> entries
+    general_items: frozenset                 # Entries with a "general" related section
+    
+    @classmethod
+    def build(cls, entries: dict[str, dict], use_location: bool) -> "ItemIndex":
+        """Index entries by description and section references."""
+        ref_items: dict[str, list[int]] = {}
+        ref_prefix_items: dict[str, list[int]] = {}
+        general = []
+        descs_lc = []
+        for idx, entry in enumerate(entries.values()):
+            descs_lc.append(entry['description'].lower())
+            
+            refs = [sec.lower() for sec in entry.get('related_sections', [])]
+            if "general" in refs:
+                general.append(idx)
+            location = entry.get('location', '') if use_location else ''
+            if location:
+                refs.append(location.lower())
+            for ref in set(refs):
+                ref_items.setdefault(ref, []).append(idx)
+                for prefix in set(_dot_prefixes(ref)):
+                    ref_prefix_items.setdefault(prefix, []).append(idx)
+        
+        descs_blob, descs_starts = _join_fields(descs_lc)
+        return cls(
+            items=tuple(entries.items()),
+            descs_blob=descs_blob,
+            descs_starts=descs_starts,
+            ref_items=ref_items,
+            ref_prefix_items=ref_prefix_items,
+            general_items=frozenset(general),
+        )
+    
+    def description_hits(self, query_lower: str) -> set[int]:
+        """Entries whose description contains the query."""
+        return set(_phrase_hits(self.descs_blob, self.descs_starts, query_lower))
+    
+    def section_hits(self, query_lower: str) -> set[int]:
+        """Entries referencing the queried section, a parent of it, or a subsection of it."""
+        hits = set(self.ref_items.get(query_lower, ()))
+        hits.update(self.ref_prefix_items.get(query_lower, ()))
+        for prefix in _dot_prefixes(query_lower):
+            hits.update(self.ref_items.get(prefix, ()))
+        return hits
+    
+    def word_hits(self, query_lower: str) -> set[int]:
+        """Entries whose description contains any query word longer than three characters."""
+        hits = set()
+        for word in set(query_lower.split()):
+            if len(word) > 3:
+                hits.update(_phrase_hits(self.descs_blob, self.descs_starts, word))
+        return hits
+    
+    def find(self, query_lower: str) -> list[tuple[str, dict, str]]:
+        """(entry ID, entry data, match type) for matching entries, in index order."""
+        desc_hits = self.description_hits(query_lower)
+        section_hits = self.section_hits(query_lower)
+        word_hits = self.word_hits(query_lower)
+        matches = []
+        for idx in sorted(desc_hits | section_hits | word_hits):
+            if idx in desc_hits:
+                match_type = "description match"
+            elif idx in section_hits:
+                match_type = "section match"
+            else:
+                match_type = "word match"
+            matches.append((*self.items[idx], match_type))
+        return matches
+
+
+class DetailIndex(NamedTuple):
+    """Search caches for a standard's sections, topics, annexes, tables and figures."""
+    annexes: ItemIndex                       # Over annexes (related sections only)
+    tables: ItemIndex                        # Over key_tables
+    figures: ItemIndex                       # Over key_figures
+    section_items: tuple                     # (section, description) pairs, in sections order
+    sections_blob: str                       # Lowercased section descriptions joined by NUL
+    sections_starts: tuple                   # Start offset of each description in sections_blob
+    table_sections: frozenset                # Sections whose description mentions a table
+    topics_lc: tuple                         # Lowercased key_topics, in key_topics order
+    topics_blob: str                         # Lowercased key_topics joined by NUL
+    topics_starts: tuple                     # Start offset of each topic in topics_blob
+    topic_matcher: "AhoCorasick"             # Lowercased key_topics, for topics inside a query
+    topic_positions: dict[str, list[int]]    # Lowercased topic -> indexes into key_topics
+
+
+@dataclass(slots=True)
 class StandardInfo:
     """Metadata about a standard."""
     id: str                              # e.g., "IEC_60601-1"
@@ -71,70 +352,147 @@ class StandardInfo:
     notes: str = ""                                               # Extraction notes/limitations
     key_topics: list[str] = field(default_factory=list)          # Fallback search terms (optional)
     
-    def matches_query(self, query: str) -> tuple[bool, float]:
-        """Check if this standard is relevant to a query. Returns (match, score)."""
-        query_lower = query.lower()
-        score = 0.0
+    # Search caches derived from the fields above (built on first use, never written to JSON)
+    _phrase_blob: str = field(default="", init=False, repr=False, compare=False)
+    _phrase_starts: tuple = field(default=(), init=False, repr=False, compare=False)
+    _phrase_weights: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _contained: tuple = field(default=(), init=False, repr=False, compare=False)  # (field index, topic/term)
+    _word_blob: str = field(default="", init=False, repr=False, compare=False)
+    _word_starts: tuple = field(default=(), init=False, repr=False, compare=False)
+    _detail: Optional[DetailIndex] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _ensure_index(self):
+        """Build the scoring index the first time this standard is scored."""
+        # Metadata is immutable once loaded, so lowercase and tokenize it once
+        if self._phrase_weights is None:
+            self._build_index()
+    
+    def _build_index(self):
+        """Precompute the lowercased phrase and word blobs used by matches_query."""
+        # Every scored field entry lowercased and joined by NUL, so one scan per
+        # query covers all phrase matches; the start offsets tell them apart
+        texts: list[str] = []
+        weights: list[float] = []
+        contained: list[tuple[int, str]] = []
         
-        # Check title
-        if query_lower in self.title.lower():
-            score += 3.0
+        def add_field(text: str, weight: float, two_way: bool = False):
+            if two_way:
+                # Topics and terms also score when they appear inside the query
+                contained.append((len(texts), text.lower()))
+            texts.append(text.lower())
+            weights.append(weight)
         
-        # Check description
-        if query_lower in self.description.lower():
-            score += 2.0
-        
-        # Check scope
-        if query_lower in self.scope.lower():
-            score += 2.0
-        
-        # Check key topics (fallback)
+        add_field(self.title, 3.0)
+        add_field(self.description, 2.0)
+        add_field(self.scope, 2.0)
         for topic in self.key_topics:
-            if query_lower in topic.lower() or topic.lower() in query_lower:
-                score += 1.5
-        
-        # Check key terms (defined terms from Section 3)
+            add_field(topic, 1.5, two_way=True)
         for term in self.key_terms:
-            if query_lower in term.lower() or term.lower() in query_lower:
-                score += 1.5
-        
-        # Check section descriptions
-        for section, desc in self.sections.items():
-            if query_lower in desc.lower():
-                score += 1.0
+            add_field(term, 1.5, two_way=True)
+        for desc in self.sections.values():
+            add_field(desc, 1.0)
+        for annex_data in self.annexes.values():
+            add_field(annex_data['description'], 0.8)
+        for table_data in self.key_tables.values():
+            add_field(table_data['description'], 1.0)
+        for figure_data in self.key_figures.values():
+            add_field(figure_data['description'], 0.5)
+        self._phrase_blob, self._phrase_starts = _join_fields(texts)
+        self._contained = tuple(contained)
         
-        # Check annex descriptions
-        for annex, annex_data in self.annexes.items():
-            if query_lower in annex_data['description'].lower():
-                score += 0.8
-        
-        # Check table descriptions
-        for table, table_data in self.key_tables.items():
-            if query_lower in table_data['description'].lower():
-                score += 1.0
+        # Single query words are looked up in the title, description, topics
+        # and terms; joining topics (and terms) by NUL keeps "in any topic" a
+        # single field hit, since query words never contain NUL
+        self._word_blob, self._word_starts = _join_fields([
+            texts[0],
+            texts[1],
+            "\x00".join(topic.lower() for topic in self.key_topics),
+            "\x00".join(term.lower() for term in self.key_terms),
+        ])
+        self._phrase_weights = tuple(weights)
+    
+    def detail_index(self) -> DetailIndex:
+        """Return the section/topic/annex/table/figure search caches, building them on first use."""
+        if self._detail is None:
+            topics_lc = [topic.lower() for topic in self.key_topics]
+            topic_matcher = AhoCorasick()
+            topic_positions: dict[str, list[int]] = {}
+            for idx, topic_lc in enumerate(topics_lc):
+                if topic_lc not in topic_positions:
+                    if topic_lc:
+                        topic_matcher.add_word(topic_lc)
+                    topic_positions[topic_lc] = []
+                topic_positions[topic_lc].append(idx)
+            topics_blob, topics_starts = _join_fields(topics_lc)
+            sections_lc = [desc.lower() for desc in self.sections.values()]
+            sections_blob, sections_starts = _join_fields(sections_lc)
+            self._detail = DetailIndex(
+                annexes=ItemIndex.build(self.annexes, use_location=False),
+                tables=ItemIndex.build(self.key_tables, use_location=True),
+                figures=ItemIndex.build(self.key_figures, use_location=True),
+                section_items=tuple(self.sections.items()),
+                sections_blob=sections_blob,
+                sections_starts=sections_starts,
+                table_sections=frozenset(
+                    sec for sec, desc_lc in zip(self.sections, sections_lc) if "table" in desc_lc
+                ),
+                topics_lc=tuple(topics_lc),
+                topics_blob=topics_blob,
+                topics_starts=topics_starts,
+                topic_matcher=topic_matcher,
+                topic_positions=topic_positions,
+            )
+        return self._detail
+    
+    def sections_containing(self, text_lower: str) -> list[tuple[str, str]]:
+        """(section, description) pairs whose description contains the text, in sections order."""
+        detail = self.detail_index()
+        return [
+            detail.section_items[idx]
+            for idx in _phrase_hits(detail.sections_blob, detail.sections_starts, text_lower)
+        ]
+    
+    def matching_topic_indexes(self, query_lower: str) -> list[int]:
+        """Indexes of key topics that contain the query or are contained in it, ascending."""
+        detail = self.detail_index()
+        hits = set(_phrase_hits(detail.topics_blob, detail.topics_starts, query_lower))
+        hits.update(detail.topic_positions.get("", ()))  # An empty topic is in every query
+        for _, topic_lc in detail.topic_matcher.iter(query_lower):
+            hits.update(detail.topic_positions[topic_lc])
+        return sorted(hits)
+    
+    def matching_topics(self, query_lower: str) -> list[str]:
+        """Key topics that contain the query or are contained in it, in key_topics order."""
+        return [self.key_topics[idx] for idx in self.matching_topic_indexes(query_lower)]
+    
+    def matches_query(self, query: str) -> tuple[bool, float]:
+        """Check if this standard is relevant to a query. Returns (match, score)."""
+        self._ensure_index()
+        query_lower = query.lower()
         
-        # Check figure descriptions
-        for figure, figure_data in self.key_figures.items():
-            if query_lower in figure_data['description'].lower():
-                score += 0.5
+        # Whole-query matches: fields containing the query, plus topics and
+        # terms contained in it, each counted once and added in field order
+        hits = set(_phrase_hits(self._phrase_blob, self._phrase_starts, query_lower))
+        hits.update(idx for idx, text in self._contained if text in query_lower)
+        score = 0.0
+        for field_idx in sorted(hits):
+            score += self._phrase_weights[field_idx]
         
-        # Check individual words
-        query_words = query_lower.split()
-        for word in query_words:
-            if len(word) > 3:  # Skip short words
-                if word in self.title.lower():
-                    score += 0.5
-                if word in self.description.lower():
-                    score += 0.3
-                if any(word in topic.lower() for topic in self.key_topics):
-                    score += 0.5
-                if any(word in term.lower() for term in self.key_terms):
-                    score += 0.5
+        # Individual words
+        for word in query_lower.split():
+            if len(word) > 3:
+                for field_idx in _phrase_hits(self._word_blob, self._word_starts, word):
+                    score += _WORD_WEIGHTS[field_idx]
         
         return (score > 0, score)
+    
+    def to_json_obj(self) -> dict:
+        """Return the serializable fields without asdict()'s recursive deep copy."""
+        # Nested values are already plain dicts/lists; skip the derived search caches
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossReference:
     """A cross-reference entry mapping a topic to standards/sections."""
     topic: str                           # The topic name (e.g., "leakage current")
@@ -145,50 +503,293 @@ class CrossReference:
     also_see: list[dict] = field(default_factory=list)  # [{standard, section, note}]
 
 
-@dataclass
+def _parse_json(raw: bytes) -> dict:
+    """Decode UTF-8 JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _intern_keys(entry: dict) -> dict:
+    """Copy a small record dict with interned keys."""
+    return {sys.intern(k): v for k, v in entry.items()}
+
+
+def _intern_value(value):
+    """Intern a string value; numbers, nulls and other JSON values pass through unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_standard_data(std_data: dict) -> dict:
+    """Intern the short strings that repeat across standards in raw index data."""
+    intern = _intern_value
+    if "organization" in std_data:
+        std_data["organization"] = intern(std_data["organization"])
+    if "year" in std_data:
+        std_data["year"] = intern(std_data["year"])
+    std_data["sections"] = {sys.intern(k): v for k, v in std_data.get("sections", {}).items()}
+    for key in ("annexes", "key_tables", "key_figures"):
+        entries = {}
+        for entry_id, entry in std_data.get(key, {}).items():
+            entry = _intern_keys(entry)
+            if "related_sections" in entry:
+                entry["related_sections"] = [intern(sec) for sec in entry["related_sections"]]
+            if "location" in entry:
+                entry["location"] = intern(entry["location"])
+            entries[sys.intern(entry_id)] = entry
+        std_data[key] = entries
+    std_data["key_terms"] = [intern(term) for term in std_data.get("key_terms", [])]
+    std_data["key_topics"] = [intern(topic) for topic in std_data.get("key_topics", [])]
+    related = []
+    for rel in std_data.get("related_standards", []):
+        if isinstance(rel, str):
+            # Older indexes list bare standard IDs; handlers expect {id, relationship, description}
+            rel = {"id": rel}
+        rel = _intern_keys(rel)
+        for key in ("id", "relationship"):
+            if key in rel:
+                rel[key] = intern(rel[key])
+        related.append(rel)
+    std_data["related_standards"] = related
+    return std_data
+
+
+def _intern_also_see(also_see: list[dict]) -> list[dict]:
+    """Intern keys and standard/section references in cross-reference also_see entries."""
+    entries = []
+    for ref in also_see:
+        if not isinstance(ref, dict):
+            entries.append(_intern_value(ref))
+            continue
+        ref = _intern_keys(ref)
+        for key in ("standard", "section"):
+            if key in ref:
+                ref[key] = _intern_value(ref[key])
+        entries.append(ref)
+    return entries
+
+
+@dataclass(slots=True)
 class StandardsLibrary:
     """The library of available standards and cross-references."""
     standards: dict[str, StandardInfo] = field(default_factory=dict)
     cross_references: dict[str, CrossReference] = field(default_factory=dict)  # topic -> CrossReference
     pdf_directory: str = "./data/pdfs"
+    _alias_index: dict[str, str] = field(default_factory=dict, init=False, repr=False)  # alias -> topic key
+    _topic_matcher: AhoCorasick = field(default_factory=AhoCorasick, init=False, repr=False)
+    _find_cache: LRUCache = field(default_factory=lambda: LRUCache(256), init=False, repr=False)
+    _topic_cache: LRUCache = field(default_factory=lambda: LRUCache(512), init=False, repr=False)
+    _output_cache: LRUCache = field(default_factory=lambda: LRUCache(512), init=False, repr=False)
+    _rendered: dict[tuple[str, str], str] = field(default_factory=dict, init=False, repr=False)  # (kind, std ID) -> markdown
+    _sorted_standards: Optional[list[tuple[str, StandardInfo]]] = field(default=None, init=False, repr=False)
+    _resources: Optional[tuple[tuple, ListResourcesResult]] = field(default=None, init=False, repr=False)  # ((PDF dir, dir mtime), result)
+    # Library-wide copies of the per-standard search blobs, indexed into _indexed
+    _indexed: list[StandardInfo] = field(default_factory=list, init=False, repr=False)
+    # All phrase fields joined by NUL, with each field's start offset, owner index and weight
+    _phrase_blob: str = field(default="", init=False, repr=False)
+    _phrase_starts: array = field(default_factory=lambda: array("i"), init=False, repr=False)
+    _phrase_owners: array = field(default_factory=lambda: array("i"), init=False, repr=False)
+    _phrase_weights: array = field(default_factory=lambda: array("d"), init=False, repr=False)
+    # Lowercased topic/term -> its phrase field indexes, and a matcher for those inside a query
+    _contained_fields: Optional[dict[str, list[int]]] = field(default=None, init=False, repr=False)
+    _contained_matcher: AhoCorasick = field(default_factory=AhoCorasick, init=False, repr=False)
+    # Word blobs, four fields per standard in _WORD_WEIGHTS order
+    _word_blob: str = field(default="", init=False, repr=False)
+    _word_starts: array = field(default_factory=lambda: array("i"), init=False, repr=False)
+    # Topic then alias keys joined by NUL, with the cross-reference each key resolves to
+    _xref_keys_blob: Optional[str] = field(default=None, init=False, repr=False)
+    _xref_keys_starts: tuple = field(default=(), init=False, repr=False)
+    _xref_key_refs: list[CrossReference] = field(default_factory=list, init=False, repr=False)
+    
+    def _invalidate_caches(self):
+        """Drop memoized query results after the library changes."""
+        self._find_cache.clear()
+        self._topic_cache.clear()
+        self._output_cache.clear()
+        self._rendered.clear()
+        self._resources = None
+    
+    def invalidate_pdf_listing(self):
+        """Forget the cached resource listing, e.g. after adding a PDF under a subdirectory."""
+        self._resources = None
     
     def add_standard(self, standard: StandardInfo):
         """Add a standard to the library."""
         self.standards[standard.id] = standard
+        self._contained_fields = None
+        self._sorted_standards = None
+        self._invalidate_caches()
+    
+    def sorted_standards(self) -> list[tuple[str, StandardInfo]]:
+        """(ID, standard) pairs sorted by ID, computed once per change to the library."""
+        if self._sorted_standards is None:
+            self._sorted_standards = sorted(self.standards.items())
+        return self._sorted_standards
     
     def add_cross_reference(self, xref: CrossReference):
         """Add a cross-reference entry."""
-        # Index by topic and all aliases
-        self.cross_references[xref.topic.lower()] = xref
+        self._xref_keys_blob = None
+        self._invalidate_caches()
+        
+        # One entry per topic; aliases point at the topic key
+        topic_key = sys.intern(xref.topic.lower())
+        if topic_key not in self.cross_references and topic_key not in self._alias_index:
+            self._topic_matcher.add_word(topic_key)
+        self.cross_references[topic_key] = xref
+        
         for alias in xref.aliases:
-            self.cross_references[alias.lower()] = xref
+            alias_key = sys.intern(alias.lower())
+            if alias_key == topic_key:
+                continue
+            if alias_key not in self.cross_references and alias_key not in self._alias_index:
+                self._topic_matcher.add_word(alias_key)
+            self._alias_index[alias_key] = topic_key
+    
+    def _resolve_key(self, key: str) -> Optional[CrossReference]:
+        """Return the cross-reference for an indexed topic or alias key."""
+        xref = self.cross_references.get(key)
+        if xref is None:
+            topic_key = self._alias_index.get(key)
+            if topic_key is not None:
+                xref = self.cross_references[topic_key]
+        return xref
     
     def lookup_topic(self, query: str) -> Optional[CrossReference]:
         """Look up a topic in cross-references. Returns None if not found."""
-        query_lower = query.lower()
+        query_lower = query.strip().lower()
         
-        # Exact match
-        if query_lower in self.cross_references:
-            return self.cross_references[query_lower]
+        cached = self._topic_cache.get(query_lower, _MISSING)
+        if cached is not _MISSING:
+            return cached
         
-        # Partial match - check if query is contained in any topic
-        for topic, xref in self.cross_references.items():
-            if query_lower in topic or topic in query_lower:
-                return xref
+        xref = self._lookup_topic_uncached(query_lower)
+        self._topic_cache.put(query_lower, xref)
+        return xref
+    
+    def _lookup_topic_uncached(self, query_lower: str) -> Optional[CrossReference]:
+        """Resolve a normalized query against the cross-reference index."""
+        # Exact match on a topic or alias
+        xref = self._resolve_key(query_lower)
+        if xref is not None:
+            return xref
+        
+        # Partial match - longest indexed topic or alias contained in the query
+        best = None
+        for _, key in self._topic_matcher.iter(query_lower):
+            if best is None or len(key) > len(best):
+                best = key
+        if best is not None:
+            return self._resolve_key(best)
+        
+        # Partial match - first indexed topic or alias containing the query
+        if self._xref_keys_blob is None:
+            self._build_xref_keys()
+        for key_idx in _phrase_hits(self._xref_keys_blob, self._xref_keys_starts, query_lower):
+            return self._xref_key_refs[key_idx]
         
         return None
     
+    def _build_xref_keys(self):
+        """Join all topic and alias keys into one blob for containment scans."""
+        keys = list(self.cross_references)
+        self._xref_key_refs = list(self.cross_references.values())
+        for alias, topic_key in self._alias_index.items():
+            keys.append(alias)
+            self._xref_key_refs.append(self.cross_references[topic_key])
+        self._xref_keys_blob, self._xref_keys_starts = _join_fields(keys)
+    
     def find_standards(self, query: str, limit: int = 3) -> list[tuple[StandardInfo, float]]:
         """Find standards relevant to a query (fallback search)."""
-        results = []
-        for std in self.standards.values():
-            matches, score = std.matches_query(query)
-            if matches:
-                results.append((std, score))
+        query_lower = query.lower()
+        query_norm = query_lower.strip()
+        key = (query_lower, limit)
+        
+        cached = self._find_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        # Only an exact topic/alias hit is trusted over scoring; the partial
+        # lookup_topic matches are too loose ("ep" is inside "sleep")
+        xref = self._resolve_key(query_norm)
+        if xref is not None and xref.primary_standard in self.standards:
+            # Curated cross-reference hit - no need to score every standard
+            results = self._standards_from_xref(xref)
+        else:
+            results = self._score_standards(query_lower, limit)
+        
+        results = results[:limit]
+        self._find_cache.put(key, results)
+        return list(results)
+    
+    def _standards_from_xref(self, xref: CrossReference) -> list[tuple[StandardInfo, float]]:
+        """Rank a cross-reference's primary standard first, then its also-see standards."""
+        results = [(self.standards[xref.primary_standard], 10.0)]
+        seen = {xref.primary_standard}
+        for ref in xref.also_see:
+            std = self.standards.get(ref['standard'])
+            if std and std.id not in seen:
+                seen.add(std.id)
+                results.append((std, 5.0))
+        return results
+    
+    def _score_standards(self, query_lower: str, limit: int) -> list[tuple[StandardInfo, float]]:
+        """Score every standard against a query and return the top `limit`, best first."""
+        if self._contained_fields is None:
+            self._build_search_arrays()
+        
+        # Same scores as StandardInfo.matches_query, from one scan of the
+        # library-wide blobs instead of a Python loop over every field
+        hits = set(_phrase_hits(self._phrase_blob, self._phrase_starts, query_lower))
+        hits.update(self._contained_fields.get("", ()))  # An empty topic is in every query
+        for _, text in self._contained_matcher.iter(query_lower):
+            hits.update(self._contained_fields[text])
+        scores = [0.0] * len(self._indexed)
+        for field_idx in sorted(hits):
+            scores[self._phrase_owners[field_idx]] += self._phrase_weights[field_idx]
+        n_word_fields = len(_WORD_WEIGHTS)
+        for word in query_lower.split():
+            if len(word) > 3:
+                for field_idx in _phrase_hits(self._word_blob, self._word_starts, word):
+                    owner, kind = divmod(field_idx, n_word_fields)
+                    scores[owner] += _WORD_WEIGHTS[kind]
         
-        # Sort by score descending
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        results = [(std, score) for std, score in zip(self._indexed, scores) if score > 0]
+        
+        # Top scores descending - O(N log limit) instead of sorting everything
+        return heapq.nlargest(limit, results, key=lambda x: x[1])
+    
+    def _build_search_arrays(self):
+        """Merge the per-standard search blobs into library-wide blobs and offset arrays."""
+        self._indexed = list(self.standards.values())
+        phrase_blobs, word_blobs = [], []
+        self._phrase_starts = array("i")
+        self._phrase_owners = array("i")
+        self._phrase_weights = array("d")
+        self._word_starts = array("i")
+        self._contained_matcher = AhoCorasick()
+        contained_fields: dict[str, list[int]] = {}
+        phrase_offset = word_offset = 0
+        for idx, std in enumerate(self._indexed):
+            std._ensure_index()
+            first_field = len(self._phrase_starts)
+            phrase_blobs.append(std._phrase_blob)
+            for start, weight in zip(std._phrase_starts, std._phrase_weights):
+                self._phrase_starts.append(phrase_offset + start)
+                self._phrase_owners.append(idx)
+                self._phrase_weights.append(weight)
+            phrase_offset += len(std._phrase_blob) + 1
+            for field_idx, text in std._contained:
+                if text not in contained_fields:
+                    if text:
+                        self._contained_matcher.add_word(text)
+                    contained_fields[text] = []
+                contained_fields[text].append(first_field + field_idx)
+            word_blobs.append(std._word_blob)
+            self._word_starts.extend(word_offset + start for start in std._word_starts)
+            word_offset += len(std._word_blob) + 1
+        self._phrase_blob = "\x00".join(phrase_blobs)
+        self._word_blob = "\x00".join(word_blobs)
+        self._contained_fields = contained_fields
     
     def get_pdf_path(self, standard_id: str) -> Optional[Path]:
         """Get the full path to a standard's PDF."""
@@ -199,57 +800,163 @@ class StandardsLibrary:
                 return path
         return None
     
+    def pdf_paths(self) -> dict[str, Optional[Path]]:
+        """Resolve every standard's PDF with one directory scan instead of a stat per standard."""
+        pdf_dir = Path(self.pdf_directory)
+        try:
+            with os.scandir(pdf_dir) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        paths = {}
+        for std_id, std in self.standards.items():
+            path = pdf_dir / std.filename
+            # Misses fall back to a stat for case-insensitive filesystems and nested filenames
+            paths[std_id] = path if std.filename in present or path.exists() else None
+        return paths
+    
     def save(self, path: str = "data/standards_index.json"):
-        """Save the library index to JSON."""
-        # Convert cross_references to serializable format (dedupe aliases)
+        """Save the library index to JSON, plus a binary sidecar for fast loading."""
+        # Convert cross_references to serializable format
         xrefs_data = {}
-        seen_topics = set()
-        for topic, xref in self.cross_references.items():
-            if xref.topic not in seen_topics:
-                seen_topics.add(xref.topic)
-                xrefs_data[xref.topic] = {
-                    "aliases": xref.aliases,
-                    "primary_standard": xref.primary_standard,
-                    "primary_section": xref.primary_section,
-                    "primary_note": xref.primary_note,
-                    "also_see": xref.also_see,
-                }
+        for xref in self.cross_references.values():
+            xrefs_data[xref.topic] = {
+                "aliases": xref.aliases,
+                "primary_standard": xref.primary_standard,
+                "primary_section": xref.primary_section,
+                "primary_note": xref.primary_note,
+                "also_see": xref.also_see,
+            }
         
         data = {
             "pdf_directory": self.pdf_directory,
-            "standards": {k: asdict(v) for k, v in self.standards.items()},
+            "standards": {k: v.to_json_obj() for k, v in self.standards.items()},
             "cross_references": xrefs_data,
         }
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        Path(path).write_bytes(payload)
+        
+        # Binary sidecar for fast startup - the JSON stays the editable source of truth
+        self._write_cache(path)
+    
+    @staticmethod
+    def _cache_path(path: str) -> Path:
+        """Path of the binary sidecar cache for an index file.
+        
+        The sidecar is read with pickle, so anyone who can write to the data
+        directory can run code in the server; keep it as trusted as the code.
+        """
+        return Path(path).with_suffix(".pickle")
+    
+    @staticmethod
+    def _cache_layout() -> tuple:
+        """Field layout of the pickled classes, so a cache written by other code is rebuilt."""
+        return (
+            _CACHE_VERSION,
+            tuple(f.name for f in fields(StandardsLibrary)),
+            tuple(f.name for f in fields(StandardInfo)),
+            tuple(f.name for f in fields(CrossReference)),
+            ItemIndex._fields,
+            DetailIndex._fields,
+        )
+    
+    @staticmethod
+    def _source_key(path: str) -> tuple[int, int]:
+        """Identify an index file version by its mtime and size."""
+        st = Path(path).stat()
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _write_cache(self, path: str, source: Optional[tuple[int, int]] = None):
+        """Pickle the built library next to the index file, tagged with the file version."""
+        if source is None:
+            source = self._source_key(path)
+        self._invalidate_caches()
+        cache_path = self._cache_path(path)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        # Plain header first, so layout and source can be checked before any class is loaded
+        header = (self._cache_layout(), __name__, source)
+        try:
+            tmp_path.write_bytes(
+                pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+                + pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not write index cache %s: %s", cache_path, e)
+            tmp_path.unlink(missing_ok=True)
     
     @classmethod
-    def load(cls, path: str = "data/standards_index.json") -> "StandardsLibrary":
-        """Load the library index from JSON."""
+    def load_cached(cls, path: str) -> tuple[Optional["StandardsLibrary"], bool]:
+        """Return the library from the sidecar cache (if any) and whether it matches the JSON."""
+        if not Path(path).exists():
+            return None, False
+        
+        cache_path = cls._cache_path(path)
+        try:
+            with open(cache_path, "rb") as f:
+                header = _CacheUnpickler(f).load()
+                if not (isinstance(header, tuple) and len(header) == 3
+                        and header[0] == cls._cache_layout() and isinstance(header[1], str)):
+                    return None, False  # Written by another version of this module
+                _, writer_module, source = header
+                cached_library = _CacheUnpickler(f, writer_module).load()
+        except FileNotFoundError:
+            return None, False
+        except Exception as e:
+            logger.warning("Ignoring unreadable index cache %s: %s", cache_path, e)
+            return None, False
+        
+        if not isinstance(cached_library, cls):
+            return None, False
+        return cached_library, source == cls._source_key(path)
+    
+    @classmethod
+    def _load_json(cls, path: str) -> "StandardsLibrary":
+        """Build the library from the JSON index and refresh its sidecar cache."""
+        json_path = Path(path)
+        if not json_path.exists():
+            return cls()
+        
+        source = cls._source_key(path)
+        library = cls._from_data(_parse_json(json_path.read_bytes()))
+        library._write_cache(path, source)
+        return library
+    
+    @classmethod
+    def _from_data(cls, data: dict) -> "StandardsLibrary":
+        """Build a library from raw index data (the JSON index layout)."""
         library = cls()
-        if Path(path).exists():
-            with open(path) as f:
-                data = json.load(f)
-            library.pdf_directory = data.get("pdf_directory", "./data/pdfs")
-            
-            # Load standards
-            for std_id, std_data in data.get("standards", {}).items():
-                library.standards[std_id] = StandardInfo(**std_data)
-            
-            # Load cross-references
-            for topic, xref_data in data.get("cross_references", {}).items():
-                xref = CrossReference(
-                    topic=topic,
-                    aliases=xref_data.get("aliases", []),
-                    primary_standard=xref_data["primary_standard"],
-                    primary_section=xref_data["primary_section"],
-                    primary_note=xref_data.get("primary_note", ""),
-                    also_see=xref_data.get("also_see", []),
-                )
-                library.add_cross_reference(xref)
+        library.pdf_directory = data.get("pdf_directory", "./data/pdfs")
+        
+        # Load standards
+        for std_id, std_data in data.get("standards", {}).items():
+            library.standards[std_id] = StandardInfo(**_intern_standard_data(std_data))
+        
+        # Load cross-references
+        for topic, xref_data in data.get("cross_references", {}).items():
+            xref = CrossReference(
+                topic=topic,
+                aliases=xref_data.get("aliases", []),
+                primary_standard=_intern_value(xref_data["primary_standard"]),
+                primary_section=_intern_value(xref_data["primary_section"]),
+                primary_note=xref_data.get("primary_note", ""),
+                also_see=_intern_also_see(xref_data.get("also_see", [])),
+            )
+            library.add_cross_reference(xref)
         
         return library
+    
+    @classmethod
+    def load(cls, path: str = "data/standards_index.json") -> "StandardsLibrary":
+        """Load the library index from JSON (or its sidecar when up to date)."""
+        cached_library, fresh = cls.load_cached(path)
+        if fresh:
+            return cached_library
+        return cls._load_json(path)
 
 
 # =============================================================================
@@ -269,6 +976,11 @@ def get_pdf_directory() -> str:
     return os.environ.get("STANDARDS_PDF_DIR", "data/pdfs")
 
 
+def get_resource_mode() -> str:
+    """Get PDF resource mode from environment or default: "blob" (inline base64) or "local" (file:// URI)."""
+    return os.environ.get("STANDARDS_RESOURCE_MODE", "blob")
+
+
 def initialize():
     """Initialize the library."""
     global library
@@ -276,708 +988,106 @@ def initialize():
     index_path = get_index_path()
     pdf_dir = get_pdf_directory()
     
-    logger.info(f"Loading standards index from: {index_path}")
-    library = StandardsLibrary.load(index_path)
+    logger.info("Loading standards index from: %s", index_path)
+    cached_library, fresh = StandardsLibrary.load_cached(index_path)
+    stale = cached_library is not None and not fresh
+    if cached_library is not None:
+        library = cached_library
+    else:
+        library = StandardsLibrary._load_json(index_path)
     library.pdf_directory = pdf_dir
     
     # If empty, create example entries
     if not library.standards:
         logger.info("No standards index found. Creating example entries.")
-        create_example_index()
+        create_example_index(index_path)
+    elif stale:
+        # Serve the previous build while the changed JSON is re-parsed in the
+        # background; never alongside create_example_index, which writes that JSON
+        logger.info("Standards index changed since last cache. Refreshing in background.")
+        threading.Thread(target=_refresh_library, args=(index_path, pdf_dir), daemon=True).start()
     
-    logger.info(f"Loaded {len(library.standards)} standards")
+    logger.info("Loaded %d standards", len(library.standards))
 
 
-def create_example_index():
-    """Create example index entries for common medical device standards."""
+def _refresh_library(index_path: str, pdf_dir: str):
+    """Re-parse the index JSON and swap the result in for the stale cached library."""
     global library
     
-    # IEC 60601-1
-    library.add_standard(StandardInfo(
-        id="IEC_60601-1",
-        title="Medical electrical equipment – Part 1: General requirements for basic safety and essential performance",
-        short_title="IEC 60601-1",
-        filename="IEC_60601-1.pdf",
-        description="General safety standard for medical electrical equipment. Covers electrical safety, mechanical safety, radiation safety, and risk management requirements for all medical devices that are electrically powered.",
-        scope="Applies to basic safety and essential performance of medical electrical equipment (ME equipment) and medical electrical systems (ME systems).",
-        key_topics=[
-            "electrical safety",
-            "patient leakage current",
-            "applied parts",
-            "Type B", "Type BF", "Type CF",
-            "means of protection",
-            "creepage distance",
-            "air clearance",
-            "protective earth",
-            "single fault condition",
-            "normal condition",
-            "risk management",
-            "essential performance",
-            "basic safety",
-            "enclosure",
-            "temperature limits",
-            "mechanical hazards",
-            "biocompatibility",
-            "cleaning and sterilization",
-            "electromagnetic compatibility",
-            "programmable electrical medical systems",
-            "PEMS",
-            "software",
-            "usability",
-            "alarms",
-            "marking and labeling",
-        ],
-        sections={
-            "1": "Scope, object and related standards",
-            "3": "Terms and definitions",
-            "4": "General requirements (risk management, essential performance)",
-            "5": "General requirements for testing",
-            "6": "Classification of ME equipment and ME systems",
-            "7": "Identification, marking and documents",
-            "8": "Protection against electrical hazards - leakage currents, dielectric strength, creepage/clearance",
-            "9": "Protection against mechanical hazards",
-            "10": "Protection against unwanted and excessive radiation hazards",
-            "11": "Protection against excessive temperatures and other hazards",
-            "12": "Accuracy of controls and instruments and protection against hazardous outputs",
-            "13": "Hazardous situations and fault conditions",
-            "14": "Programmable electrical medical systems (PEMS)",
-            "15": "Construction of ME equipment",
-            "16": "ME systems",
-            "17": "Electromagnetic compatibility",
-        },
-        annexes={
-            "Annex A": {
-                "description": "General requirements, tests and guidance for alarm systems in ME equipment",
-                "normative": True,
-                "related_sections": ["12"]
-            },
-            "Annex B": {
-                "description": "General requirements, tests and guidance for ME systems",
-                "normative": True,
-                "related_sections": ["16"]
-            },
-            "Annex F": {
-                "description": "Test methods for leakage currents and patient auxiliary currents",
-                "normative": True,
-                "related_sections": ["8.7"]
-            },
-            "Annex H": {
-                "description": "Rationale for PEMS requirements - software safety guidance",
-                "normative": False,
-                "related_sections": ["14"]
-            },
-            "Annex J": {
-                "description": "Rationale for electrical safety requirements",
-                "normative": False,
-                "related_sections": ["8"]
-            },
-        },
-        key_terms=[
-            "APPLIED PART",
-            "BASIC SAFETY",
-            "ESSENTIAL PERFORMANCE",
-            "LEAKAGE CURRENT",
-            "PATIENT LEAKAGE CURRENT",
-            "TOUCH CURRENT",
-            "EARTH LEAKAGE CURRENT",
-            "MEANS OF OPERATOR PROTECTION",
-            "MEANS OF PATIENT PROTECTION",
-            "SINGLE FAULT CONDITION",
-            "NORMAL CONDITION",
-            "TYPE B APPLIED PART",
-            "TYPE BF APPLIED PART",
-            "TYPE CF APPLIED PART",
-            "PEMS",
-            "ME EQUIPMENT",
-            "ME SYSTEM",
-        ],
-        key_tables={
-            "Table 1": {
-                "description": "Classification of APPLIED PARTS - Type B, BF, CF symbols and descriptions",
-                "location": "6.3",
-                "related_sections": ["8.7", "8.5"]
-            },
-            "Table 3": {
-                "description": "Allowable values of PATIENT LEAKAGE CURRENT and PATIENT AUXILIARY CURRENT - NC and SFC limits",
-                "location": "8.7.3",
-                "related_sections": ["8.7.4", "Annex F"]
-            },
-            "Table 4": {
-                "description": "Allowable values of TOUCH CURRENT and EARTH LEAKAGE CURRENT",
-                "location": "8.7.3",
-                "related_sections": ["Annex F"]
-            },
-            "Table 6": {
-                "description": "Creepage distances and air clearances - MOOP values",
-                "location": "8.9",
-                "related_sections": ["8.8"]
-            },
-            "Table 10": {
-                "description": "Maximum temperatures of applied parts and surfaces",
-                "location": "11.1",
-                "related_sections": []
-            },
-        },
-        key_figures={
-            "Figure 1": {
-                "description": "Relationship of standards in the IEC 60601 series",
-                "location": "1",
-                "related_sections": []
-            },
-            "Figure 3": {
-                "description": "Classification decision tree for applied parts",
-                "location": "6.3",
-                "related_sections": ["8.7"]
-            },
-            "Figure F.1": {
-                "description": "Test circuit for measurement of PATIENT LEAKAGE CURRENT - Type B applied part",
-                "location": "Annex F",
-                "related_sections": ["8.7.3", "8.7.4"]
-            },
-            "Figure F.2": {
-                "description": "Test circuit for measurement of PATIENT LEAKAGE CURRENT - Type BF applied part",
-                "location": "Annex F",
-                "related_sections": ["8.7.3", "8.7.4"]
-            },
-            "Figure H.1": {
-                "description": "Overview of PEMS development process",
-                "location": "Annex H",
-                "related_sections": ["14"]
-            },
-        },
-        related_standards=[
-            {
-                "id": "ISO_14971",
-                "relationship": "normative_reference",
-                "description": "Risk management - required for clause 4 compliance"
-            },
-            {
-                "id": "IEC_62304",
-                "relationship": "gap_coverage",
-                "description": "Software lifecycle - referenced by clause 14 (PEMS) for detailed software requirements"
-            },
-            {
-                "id": "IEC_60601-1-2",
-                "relationship": "collateral_standard",
-                "description": "EMC requirements - detailed electromagnetic compatibility requirements for clause 17"
-            },
-            {
-                "id": "IEC_60601-1-6",
-                "relationship": "collateral_standard",
-                "description": "Usability - detailed usability engineering requirements"
-            },
-            {
-                "id": "IEC_60601-1-8",
-                "relationship": "collateral_standard",
-                "description": "Alarm systems - detailed requirements supplementing Annex A"
-            },
-        ],
-        organization="IEC",
-        year="2005+AMD1:2012",
-        pages=500,
-    ))
-    
-    # ISO 14708-1
-    library.add_standard(StandardInfo(
-        id="ISO_14708-1",
-        title="Implants for surgery — Active implantable medical devices — Part 1: General requirements for safety, marking and for information to be provided by the manufacturer",
-        short_title="ISO 14708-1",
-        filename="ISO_14708-1.pdf",
-        description="Specific requirements for active implantable medical devices (AIMDs) such as pacemakers, defibrillators, neurostimulators, and implantable drug pumps. Supplements IEC 60601-1 with implant-specific requirements.",
-        scope="Applies to active implantable medical devices intended to be totally or partially introduced into the human body.",
-        key_topics=[
-            "active implantable medical device",
-            "AIMD",
-            "pacemaker",
-            "defibrillator",
-            "ICD",
-            "neurostimulator",
-            "implantable pump",
-            "cochlear implant",
-            "implant safety",
-            "biocompatibility",
-            "sterility",
-            "packaging",
-            "shelf life",
-            "implant longevity",
-            "battery life",
-            "hermeticity",
-            "MRI safety",
-            "electromagnetic immunity",
-            "wireless telemetry",
-            "patient programmer",
-            "clinician programmer",
-        ],
-        sections={
-            "1": "Scope",
-            "3": "Terms and definitions",
-            "4": "General requirements",
-            "5": "Protection against electrical hazards",
-            "6": "Protection against mechanical hazards",
-            "7": "Protection against radiation hazards",
-            "8": "Protection against excessive temperatures",
-            "9": "Protection against hazards from energy and substance delivery",
-            "10": "Environmental conditions",
-            "11": "Biocompatibility",
-            "12": "Sterility",
-            "13": "Instructions for use and labeling",
-        },
-        annexes={
-            "Annex A": {
-                "description": "Rationale for requirements",
-                "normative": False,
-                "related_sections": ["general"]
-            },
-            "Annex B": {
-                "description": "Test methods for hermeticity",
-                "normative": True,
-                "related_sections": ["6"]
-            },
-        },
-        key_terms=[
-            "ACTIVE IMPLANTABLE MEDICAL DEVICE",
-            "AIMD",
-            "IMPLANTABLE PART",
-            "NON-IMPLANTABLE PART",
-            "PROGRAMMER",
-            "THERAPEUTIC OUTPUT",
-        ],
-        key_tables={
-            "Table 1": {
-                "description": "Environmental conditions for storage and transport",
-                "location": "10",
-                "related_sections": []
-            },
-        },
-        key_figures={
-            "Figure 1": {
-                "description": "Example AIMD system showing implantable and non-implantable parts",
-                "location": "3",
-                "related_sections": ["4", "5"]
-            },
-        },
-        related_standards=[
-            {
-                "id": "IEC_60601-1",
-                "relationship": "parent_standard",
-                "description": "General safety requirements - ISO 14708-1 modifies and supplements 60601-1 for implants"
-            },
-            {
-                "id": "ISO_14971",
-                "relationship": "normative_reference",
-                "description": "Risk management process"
-            },
-            {
-                "id": "ISO_10993-1",
-                "relationship": "normative_reference",
-                "description": "Biocompatibility evaluation - required for clause 11"
-            },
-            {
-                "id": "IEC_62304",
-                "relationship": "normative_reference",
-                "description": "Software lifecycle for AIMD software"
-            },
-        ],
-        organization="ISO",
-        year="2014",
-        pages=100,
-    ))
-    
-    # ISO 14971
-    library.add_standard(StandardInfo(
-        id="ISO_14971",
-        title="Medical devices — Application of risk management to medical devices",
-        short_title="ISO 14971",
-        filename="ISO_14971.pdf",
-        description="The fundamental risk management standard for medical devices. Defines the process for identifying hazards, estimating and evaluating risks, controlling risks, and monitoring effectiveness.",
-        scope="Applies to all stages of the medical device lifecycle. Applicable to any medical device.",
-        key_topics=[
-            "risk management",
-            "risk analysis",
-            "risk evaluation",
-            "risk control",
-            "hazard identification",
-            "harm",
-            "severity",
-            "probability",
-            "risk estimation",
-            "risk acceptability",
-            "ALARP",
-            "benefit-risk",
-            "residual risk",
-            "risk management file",
-            "risk management plan",
-            "risk management report",
-            "foreseeable misuse",
-            "intended use",
-            "reasonably foreseeable misuse",
-            "FMEA",
-            "fault tree",
-            "hazard analysis",
-        ],
-        sections={
-            "1": "Scope",
-            "3": "Terms and definitions - 26 defined terms including harm, hazard, risk, severity",
-            "4": "General requirements for risk management - process, plan, file, competence",
-            "5": "Risk analysis - intended use, hazard identification, risk estimation",
-            "6": "Risk evaluation - criteria for risk acceptability",
-            "7": "Risk control - option analysis, implementation, residual risk, benefit-risk",
-            "8": "Evaluation of overall residual risk",
-            "9": "Risk management review",
-            "10": "Production and post-production activities",
-        },
-        annexes={
-            "Annex A": {
-                "description": "Rationale for requirements - explains reasoning behind each clause",
-                "normative": False,
-                "related_sections": ["4", "5", "6", "7", "8", "9", "10"]
-            },
-            "Annex B": {
-                "description": "Risk management process overview - flowcharts and process description",
-                "normative": False,
-                "related_sections": ["4", "general"]
-            },
-            "Annex C": {
-                "description": "Questions for identifying characteristics that could impact safety - hazard identification prompts",
-                "normative": False,
-                "related_sections": ["5"]
-            },
-        },
-        key_terms=[
-            "HARM",
-            "HAZARD",
-            "HAZARDOUS SITUATION",
-            "RISK",
-            "SEVERITY",
-            "PROBABILITY OF OCCURRENCE",
-            "RISK ANALYSIS",
-            "RISK ASSESSMENT",
-            "RISK CONTROL",
-            "RISK ESTIMATION",
-            "RISK EVALUATION",
-            "RISK MANAGEMENT",
-            "RISK MANAGEMENT FILE",
-            "RESIDUAL RISK",
-            "BENEFIT-RISK ANALYSIS",
-            "INTENDED USE",
-            "REASONABLY FORESEEABLE MISUSE",
-        ],
-        key_tables={},
-        key_figures={
-            "Figure 1": {
-                "description": "Schematic representation of the risk management process",
-                "location": "4",
-                "related_sections": ["5", "6", "7"]
-            },
-            "Figure B.1": {
-                "description": "Risk management process flowchart - complete overview",
-                "location": "Annex B",
-                "related_sections": ["4"]
-            },
-            "Figure B.2": {
-                "description": "Risk analysis process flowchart",
-                "location": "Annex B",
-                "related_sections": ["5"]
-            },
-            "Figure B.3": {
-                "description": "Risk control process flowchart",
-                "location": "Annex B",
-                "related_sections": ["7"]
-            },
-        },
-        related_standards=[
-            {
-                "id": "IEC_60601-1",
-                "relationship": "overlapping",
-                "description": "Medical electrical equipment - requires ISO 14971 compliance, applies risk to electrical hazards"
-            },
-            {
-                "id": "IEC_62304",
-                "relationship": "overlapping",
-                "description": "Medical device software - requires ISO 14971 for software risk management and safety classification"
-            },
-            {
-                "id": "ISO_13485",
-                "relationship": "normative_reference",
-                "description": "Quality management systems - requires risk-based approach, references ISO 14971"
-            },
-            {
-                "id": "ISO_TR_24971",
-                "relationship": "informative_reference",
-                "description": "Guidance on application - technical report with detailed guidance on applying ISO 14971"
-            },
-        ],
-        organization="ISO",
-        year="2019",
-        pages=40,
-    ))
-    
-    # IEC 62304
-    library.add_standard(StandardInfo(
-        id="IEC_62304",
-        title="Medical device software – Software life cycle processes",
-        short_title="IEC 62304",
-        filename="IEC_62304.pdf",
-        description="Software lifecycle standard for medical device software. Defines development, maintenance, risk management, configuration management, and problem resolution processes based on software safety classification.",
-        scope="Applies to development and maintenance of medical device software. Covers software as a medical device (SaMD) and software in a medical device.",
-        key_topics=[
-            "software lifecycle",
-            "software development",
-            "software safety classification",
-            "Class A", "Class B", "Class C",
-            "software requirements",
-            "software architecture",
-            "software design",
-            "software unit",
-            "software integration",
-            "software testing",
-            "software verification",
-            "software validation",
-            "software configuration management",
-            "software problem resolution",
-            "software maintenance",
-            "SOUP",
-            "software of unknown provenance",
-            "off-the-shelf software",
-            "OTS",
-            "traceability",
-            "software anomaly",
-            "regression testing",
-        ],
-        sections={
-            "1": "Scope",
-            "3": "Terms and definitions",
-            "4": "General requirements - quality management, risk management, software safety classification",
-            "5": "Software development process - planning, requirements, architecture, design, unit implementation, integration, testing",
-            "6": "Software maintenance process",
-            "7": "Software risk management process - hazard analysis, risk control, verification",
-            "8": "Software configuration management process",
-            "9": "Software problem resolution process",
-        },
-        annexes={
-            "Annex A": {
-                "description": "Rationale for requirements",
-                "normative": False,
-                "related_sections": ["general"]
-            },
-            "Annex B": {
-                "description": "Guidance on provisions of this standard - detailed implementation guidance",
-                "normative": False,
-                "related_sections": ["4", "5", "6", "7", "8", "9"]
-            },
-            "Annex C": {
-                "description": "Relationship to other standards - mapping to IEC 60601-1, ISO 14971",
-                "normative": False,
-                "related_sections": ["general"]
-            },
-        },
-        key_terms=[
-            "SOFTWARE SAFETY CLASS",
-            "CLASS A",
-            "CLASS B", 
-            "CLASS C",
-            "SOUP",
-            "SOFTWARE UNIT",
-            "SOFTWARE ITEM",
-            "SOFTWARE SYSTEM",
-            "SOFTWARE ARCHITECTURE",
-            "TRACEABILITY",
-            "SOFTWARE ANOMALY",
-            "SOFTWARE PROBLEM REPORT",
-        ],
-        key_tables={
-            "Table A.1": {
-                "description": "Software safety classification - determines required activities based on risk",
-                "location": "4.3",
-                "related_sections": ["5", "7"]
-            },
-            "Table A.2": {
-                "description": "Activities required by software safety class",
-                "location": "Annex A",
-                "related_sections": ["4.3", "5"]
-            },
-        },
-        key_figures={
-            "Figure 1": {
-                "description": "Software development process overview",
-                "location": "5",
-                "related_sections": ["4"]
-            },
-            "Figure 2": {
-                "description": "Relationship between software items, units, and systems",
-                "location": "3",
-                "related_sections": ["5"]
-            },
-        },
-        related_standards=[
-            {
-                "id": "ISO_14971",
-                "relationship": "normative_reference",
-                "description": "Risk management - required for software safety classification and risk control"
-            },
-            {
-                "id": "IEC_60601-1",
-                "relationship": "overlapping",
-                "description": "Medical electrical equipment - clause 14 (PEMS) references IEC 62304 for software"
-            },
-            {
-                "id": "IEC_82304-1",
-                "relationship": "overlapping",
-                "description": "Health software - general requirements for standalone health software"
-            },
-            {
-                "id": "ISO_13485",
-                "relationship": "overlapping",
-                "description": "Quality management - design control requirements apply to software development"
-            },
-        ],
-        organization="IEC",
-        year="2006+AMD1:2015",
-        pages=80,
-    ))
-    
-    # ==========================================================================
-    # Cross-References - Quick lookup for common topics
-    # ==========================================================================
-    
-    library.add_cross_reference(CrossReference(
-        topic="leakage current",
-        aliases=["patient leakage current", "leakage current limits", "touch current", "earth leakage"],
-        primary_standard="IEC_60601-1",
-        primary_section="8.7",
-        primary_note="Allowable values in Table 3 and Table 4. Test methods in Annex F.",
-        also_see=[
-            {"standard": "IEC_60601-1", "section": "Annex F", "note": "Test circuits and measurement methods"},
-            {"standard": "ISO_14708-1", "section": "5", "note": "Implant-specific electrical requirements"},
-        ]
-    ))
-    
-    library.add_cross_reference(CrossReference(
-        topic="software safety classification",
-        aliases=["software class", "Class A", "Class B", "Class C", "safety classification"],
-        primary_standard="IEC_62304",
-        primary_section="4.3",
-        primary_note="Classification based on severity of harm. Determines required activities.",
-        also_see=[
-            {"standard": "IEC_60601-1", "section": "14", "note": "PEMS requirements reference 62304"},
-            {"standard": "ISO_14971", "section": "5", "note": "Risk analysis informs classification"},
-        ]
-    ))
-    
-    library.add_cross_reference(CrossReference(
-        topic="risk management",
-        aliases=["risk analysis", "hazard analysis", "risk control", "risk assessment"],
-        primary_standard="ISO_14971",
-        primary_section="4-10",
-        primary_note="Complete risk management process. Sections 4-10 cover plan through post-production.",
-        also_see=[
-            {"standard": "IEC_60601-1", "section": "4", "note": "Risk management requirements for ME equipment"},
-            {"standard": "IEC_62304", "section": "7", "note": "Software-specific risk management"},
-        ]
-    ))
-    
-    library.add_cross_reference(CrossReference(
-        topic="essential performance",
-        aliases=["EP", "clinical function"],
-        primary_standard="IEC_60601-1",
-        primary_section="4.3",
-        primary_note="Performance necessary to avoid unacceptable risk. Manufacturer-defined.",
-        also_see=[
-            {"standard": "ISO_14971", "section": "5", "note": "Risk analysis identifies essential performance"},
-        ]
-    ))
-    
-    library.add_cross_reference(CrossReference(
-        topic="applied part",
-        aliases=["applied parts", "Type B", "Type BF", "Type CF", "patient connection"],
-        primary_standard="IEC_60601-1",
-        primary_section="6.3",
-        primary_note="Classification in Table 1. Affects leakage current limits.",
-        also_see=[
-            {"standard": "IEC_60601-1", "section": "8.7", "note": "Leakage limits by applied part type"},
-        ]
-    ))
-    
-    library.add_cross_reference(CrossReference(
-        topic="biocompatibility",
-        aliases=["biocompatible", "biological evaluation", "ISO 10993"],
-        primary_standard="IEC_60601-1",
-        primary_section="11.7",
-        primary_note="References ISO 10993-1 for biological evaluation.",
-        also_see=[
-            {"standard": "ISO_14708-1", "section": "11", "note": "Implant-specific biocompatibility"},
-        ]
-    ))
-    
-    library.add_cross_reference(CrossReference(
-        topic="SOUP",
-        aliases=["software of unknown provenance", "OTS", "off-the-shelf software", "third-party software"],
-        primary_standard="IEC_62304",
-        primary_section="5.3",
-        primary_note="Requirements for using SOUP in medical device software.",
-        also_see=[]
-    ))
-    
-    library.add_cross_reference(CrossReference(
-        topic="creepage",
-        aliases=["creepage distance", "air clearance", "clearance", "insulation"],
-        primary_standard="IEC_60601-1",
-        primary_section="8.9",
-        primary_note="Creepage distances and air clearances in Table 6 and Table 12.",
-        also_see=[]
-    ))
-    
-    library.add_cross_reference(CrossReference(
-        topic="usability",
-        aliases=["usability engineering", "human factors", "use error"],
-        primary_standard="IEC_60601-1",
-        primary_section="12",
-        primary_note="Accuracy of controls. Full usability in IEC 60601-1-6 / IEC 62366.",
-        also_see=[
-            {"standard": "ISO_14971", "section": "5", "note": "Use errors as hazards"},
-        ]
-    ))
+    try:
+        refreshed = StandardsLibrary._load_json(index_path)
+    except Exception as e:
+        logger.warning("Background refresh of %s failed: %s", index_path, e)
+        return
+    refreshed.pdf_directory = pdf_dir
+    library = refreshed
+    logger.info("Refreshed standards index: %d standards", len(library.standards))
+
+
+# Seed data for a fresh install, shipped with the package
+SEED_INDEX_PATH = Path(__file__).parent / "data" / "standards_seed.json"
+
+
+def create_example_index(index_path: Optional[str] = None):
+    """Create example index entries for common medical device standards."""
+    global library
     
-    library.add_cross_reference(CrossReference(
-        topic="alarm",
-        aliases=["alarms", "alarm system", "alert", "alarm signal"],
-        primary_standard="IEC_60601-1",
-        primary_section="Annex A",
-        primary_note="Normative annex for alarm systems. Full requirements in IEC 60601-1-8.",
-        also_see=[]
-    ))
+    seed = StandardsLibrary._from_data(_parse_json(SEED_INDEX_PATH.read_bytes()))
+    for std in seed.standards.values():
+        library.add_standard(std)
+    for xref in seed.cross_references.values():
+        library.add_cross_reference(xref)
     
     # Save the index
-    library.save(get_index_path())
-    logger.info(f"Created example index with {len(library.standards)} standards and {len(set(x.topic for x in library.cross_references.values()))} cross-reference topics")
+    library.save(index_path or get_index_path())
+    logger.info(
+        "Created example index with %d standards and %d cross-reference topics",
+        len(library.standards), len(library.cross_references),
+    )
 
 
 # =============================================================================
 # Tool Definitions
 # =============================================================================
 
-TOOLS = [
-    Tool(
-        name="list_available_standards",
-        description="""List all regulatory standards available in the library.
-        
+def _string_property(description: str) -> dict:
+    """Schema for a string tool argument."""
+    return {"type": "string", "description": description}
+
+
+def _object_schema(required: tuple[str, ...] = (), **properties: dict) -> dict:
+    """inputSchema for a tool taking the given named arguments."""
+    schema = {"type": "object", "properties": properties}
+    if required:
+        schema["required"] = list(required)
+    return schema
+
+
+# Schema fragments shared by several tools (never mutated)
+_EMPTY_SCHEMA = _object_schema()
+_STANDARD_ID_PROPERTY = _string_property("Standard ID")
+_STANDARD_ID_SCHEMA = _object_schema(required=("standard_id",), standard_id=_STANDARD_ID_PROPERTY)
+
+# Tool table: (name, description, inputSchema); Tool objects are built on first use
+_TOOL_SPECS = (
+    (
+        "list_available_standards",
+        """List all regulatory standards available in the library.
+
 Use this first to see what standards you have access to.
 Returns the ID, title, and brief description of each standard.
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {}
-        }
+        _EMPTY_SCHEMA
     ),
     
-    Tool(
-        name="lookup_topic",
-        description="""Look up a topic directly in the cross-reference index.
-        
-This is the FASTEST way to find where a topic is covered. Returns the primary 
+    (
+        "lookup_topic",
+        """Look up a topic directly in the cross-reference index.
+
+This is the FASTEST way to find where a topic is covered. Returns the primary
 standard and section, plus other relevant locations.
 
-USE THIS FIRST when you know what topic you're looking for. Only fall back to 
+USE THIS FIRST when you know what topic you're looking for. Only fall back to
 find_relevant_standards if the topic isn't in the cross-reference index.
 
 Examples:
@@ -986,23 +1096,17 @@ Examples:
 - "risk management" → ISO 14971 Section 4-10
 - "EMC" → IEC 60601-1-2 (entire standard)
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "The topic to look up (e.g., 'leakage current', 'software classification', 'EMC')"
-                }
-            },
-            "required": ["topic"]
-        }
+        _object_schema(
+            required=("topic",),
+            topic=_string_property("The topic to look up (e.g., 'leakage current', 'software classification', 'EMC')"),
+        )
     ),
     
-    Tool(
-        name="find_relevant_standards",
-        description="""Find which standard(s) are most relevant for a topic or question.
-        
-NOTE: Try lookup_topic FIRST - it's faster and more precise. Use this tool as a 
+    (
+        "find_relevant_standards",
+        """Find which standard(s) are most relevant for a topic or question.
+
+NOTE: Try lookup_topic FIRST - it's faster and more precise. Use this tool as a
 FALLBACK when the topic isn't in the cross-reference index.
 
 This searches through all standards' metadata using keyword matching.
@@ -1014,129 +1118,87 @@ Examples:
 - "implantable device requirements" → ISO 14708-1
 - "risk analysis process" → ISO 14971
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "The topic, question, or requirement you're looking for"
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of standards to return (default: 3)",
-                    "default": 3
-                }
+        _object_schema(
+            required=("query",),
+            query=_string_property("The topic, question, or requirement you're looking for"),
+            limit={
+                "type": "integer",
+                "description": "Maximum number of standards to return (default: 3)",
+                "default": 3
             },
-            "required": ["query"]
-        }
+        )
     ),
     
-    Tool(
-        name="get_all_standards_for_semantic_search",
-        description="""Get descriptions of ALL available standards so you can determine which is most relevant.
-        
-Use this when you need to find which standard covers a topic, and the topic might use 
-different terminology than what's in the index. This returns full descriptions of all 
+    (
+        "get_all_standards_for_semantic_search",
+        """Get descriptions of ALL available standards so you can determine which is most relevant.
+
+Use this when you need to find which standard covers a topic, and the topic might use
+different terminology than what's in the index. This returns full descriptions of all
 standards so YOU (Claude) can use your semantic understanding to find the right one.
 
-For example, if someone asks about "creepage distances" or "dielectric strength", 
-this will return the IEC 60601-1 description which mentions "electrical safety" - 
+For example, if someone asks about "creepage distances" or "dielectric strength",
+this will return the IEC 60601-1 description which mentions "electrical safety" -
 and you'll understand these are related.
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {}
-        }
+        _EMPTY_SCHEMA
     ),
     
-    Tool(
-        name="get_standard_overview",
-        description="""Get detailed information about a specific standard.
-        
+    (
+        "get_standard_overview",
+        """Get detailed information about a specific standard.
+
 Returns the standard's scope, what topics it covers, its section structure,
 and related standards. Use this to understand what's in a standard before
 reading the full PDF.
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "standard_id": {
-                    "type": "string",
-                    "description": "Standard ID (e.g., 'IEC_60601-1', 'ISO_14971')"
-                }
-            },
-            "required": ["standard_id"]
-        }
+        _object_schema(
+            required=("standard_id",),
+            standard_id=_string_property("Standard ID (e.g., 'IEC_60601-1', 'ISO_14971')"),
+        )
     ),
     
-    Tool(
-        name="find_section",
-        description="""Find which section of a standard covers a specific topic.
-        
+    (
+        "find_section",
+        """Find which section of a standard covers a specific topic.
+
 Use this to narrow down where to look within a standard.
 Returns the relevant section number(s) and descriptions.
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "standard_id": {
-                    "type": "string",
-                    "description": "Standard ID"
-                },
-                "topic": {
-                    "type": "string",
-                    "description": "The topic you're looking for"
-                }
-            },
-            "required": ["standard_id", "topic"]
-        }
+        _object_schema(
+            required=("standard_id", "topic"),
+            standard_id=_STANDARD_ID_PROPERTY,
+            topic=_string_property("The topic you're looking for"),
+        )
     ),
     
-    Tool(
-        name="get_related_standards",
-        description="""Get standards that are related to a given standard.
-        
+    (
+        "get_related_standards",
+        """Get standards that are related to a given standard.
+
 Useful for understanding the regulatory ecosystem and finding additional
 relevant requirements.
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "standard_id": {
-                    "type": "string",
-                    "description": "Standard ID"
-                }
-            },
-            "required": ["standard_id"]
-        }
+        _STANDARD_ID_SCHEMA
     ),
     
-    Tool(
-        name="get_pdf_for_reading",
-        description="""Get the PDF file for a standard so you can read it directly.
-        
+    (
+        "get_pdf_for_reading",
+        """Get the PDF file for a standard so you can read it directly.
+
 Use this when you need to read the actual standard content.
 Returns the file path and basic info about the PDF.
 
 IMPORTANT: After calling this, you can ask the user to share the PDF,
 or if you have file access, you can read it directly.
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "standard_id": {
-                    "type": "string",
-                    "description": "Standard ID"
-                }
-            },
-            "required": ["standard_id"]
-        }
+        _STANDARD_ID_SCHEMA
     ),
     
-    Tool(
-        name="find_table",
-        description="""Find which table in a standard contains specific information.
-        
+    (
+        "find_table",
+        """Find which table in a standard contains specific information.
+
 Use this when looking for specific values, limits, or classifications that are
 typically found in tables. Returns matching tables with their descriptions.
 
@@ -1145,26 +1207,17 @@ Examples:
 - "software safety classification" → Table in IEC 62304
 - "applied part classification" → Table 1 in IEC 60601-1
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "standard_id": {
-                    "type": "string",
-                    "description": "Standard ID"
-                },
-                "topic": {
-                    "type": "string",
-                    "description": "What information you're looking for"
-                }
-            },
-            "required": ["standard_id", "topic"]
-        }
+        _object_schema(
+            required=("standard_id", "topic"),
+            standard_id=_STANDARD_ID_PROPERTY,
+            topic=_string_property("What information you're looking for"),
+        )
     ),
     
-    Tool(
-        name="find_annex",
-        description="""Find annexes in a standard that relate to a specific section or topic.
-        
+    (
+        "find_annex",
+        """Find annexes in a standard that relate to a specific section or topic.
+
 Use this when:
 - You found a requirement and want supporting test methods or guidance
 - You want to know what normative annexes apply to a section
@@ -1172,26 +1225,17 @@ Use this when:
 
 Returns matching annexes with their normative status and related sections.
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "standard_id": {
-                    "type": "string",
-                    "description": "Standard ID"
-                },
-                "section_or_topic": {
-                    "type": "string",
-                    "description": "Section number (e.g., '8.7') or topic (e.g., 'leakage current')"
-                }
-            },
-            "required": ["standard_id", "section_or_topic"]
-        }
+        _object_schema(
+            required=("standard_id", "section_or_topic"),
+            standard_id=_STANDARD_ID_PROPERTY,
+            section_or_topic=_string_property("Section number (e.g., '8.7') or topic (e.g., 'leakage current')"),
+        )
     ),
     
-    Tool(
-        name="find_figure",
-        description="""Find which figure in a standard illustrates specific information.
-        
+    (
+        "find_figure",
+        """Find which figure in a standard illustrates specific information.
+
 Use this when looking for diagrams, flowcharts, test circuits, or visual references.
 Returns matching figures with their descriptions and locations.
 
@@ -1200,36 +1244,223 @@ Examples:
 - "risk management process" → Figure 1 in ISO 14971
 - "software development" → Figure 1 in IEC 62304
 """,
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "standard_id": {
-                    "type": "string",
-                    "description": "Standard ID"
-                },
-                "topic": {
-                    "type": "string",
-                    "description": "What you're looking for (e.g., 'test circuit', 'flowchart', 'classification')"
-                }
-            },
-            "required": ["standard_id", "topic"]
-        }
+        _object_schema(
+            required=("standard_id", "topic"),
+            standard_id=_STANDARD_ID_PROPERTY,
+            topic=_string_property("What you're looking for (e.g., 'test circuit', 'flowchart', 'classification')"),
+        )
     ),
-]
+)
+
+
+@functools.cache
+def get_tools() -> list[Tool]:
+    """Build the Tool objects from _TOOL_SPECS once, on first request."""
+    return [Tool(name=name, description=description, inputSchema=schema) for name, description, schema in _TOOL_SPECS]
+
+
+@functools.cache
+def get_list_tools_result() -> ListToolsResult:
+    """The tools/list response; the tool table is static, so it is built once."""
+    return ListToolsResult(tools=get_tools())
 
 
 # =============================================================================
 # Tool Handlers
 # =============================================================================
 
+def _memoize_output(handler):
+    """Cache a handler's output on the current library, keyed by its arguments.
+    
+    Only for handlers that read nothing but the library - not PDF availability,
+    which can change on disk while the server runs.
+    """
+    name = handler.__name__
+    
+    @functools.wraps(handler)
+    async def wrapper(arguments: dict) -> str:
+        try:
+            key = (name, frozenset(arguments.items()))
+        except TypeError:
+            key = None  # Unhashable argument values are not cached
+        if key is None:
+            return await handler(arguments)
+        # The cache lives on the library, so a reloaded library starts empty
+        lib = library
+        result = lib._output_cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = await handler(arguments)
+            # Don't file output rendered from a library swapped in during the await
+            if library is lib:
+                lib._output_cache.put(key, result)
+        return result
+    
+    return wrapper
+
+
+def _render_cached(kind: str, std: StandardInfo, render) -> str:
+    """Render a standard's static markdown once per library and reuse it."""
+    key = (kind, std.id)
+    text = library._rendered.get(key)
+    if text is None:
+        text = render(std)
+        library._rendered[key] = text
+    return text
+
+
+def _render_semantic(std: StandardInfo) -> str:
+    """Markdown block for one standard in get_all_standards_for_semantic_search, minus PDF status."""
+    output = [f"## {std.short_title} (`{std.id}`)"]
+    output.append(f"\n**Title:** {std.title}\n")
+    output.append(f"**Scope:** {std.scope}\n")
+    output.append(f"**Description:** {std.description}\n")
+    
+    output.append("**Sections:**")
+    for sec, desc in std.sections.items():
+        output.append(f"- {sec}: {desc}")
+    
+    # Show annexes with related sections
+    if std.annexes:
+        output.append("\n**Annexes:**")
+        for annex_id, annex_data in std.annexes.items():
+            status = "normative" if annex_data['normative'] else "informative"
+            related = annex_data.get('related_sections', [])
+            line = f"- {annex_id} ({status}): {annex_data['description']}"
+            if related:
+                line += f" [relates to: {', '.join(related)}]"
+            output.append(line)
+    
+    # Show key tables with locations
+    if std.key_tables:
+        output.append("\n**Key Tables:**")
+        for table_id, table_data in std.key_tables.items():
+            location = table_data.get('location', '')
+            related = table_data.get('related_sections', [])
+            if location:
+                line = f"- {table_id} (Section {location}): {table_data['description']}"
+            else:
+                line = f"- {table_id}: {table_data['description']}"
+            if related:
+                line += f" [also: {', '.join(related)}]"
+            output.append(line)
+    
+    output.append(f"\n**Key topics:** {', '.join(std.key_topics)}")
+    
+    if std.key_terms:
+        output.append(f"\n**Defined terms:** {', '.join(std.key_terms[:10])}")
+        if len(std.key_terms) > 10:
+            output.append(f"  ...and {len(std.key_terms) - 10} more")
+    
+    return "\n".join(output)
+
+
+def _render_overview(std: StandardInfo) -> str:
+    """Markdown for get_standard_overview, minus the PDF status line."""
+    output = [f"# {std.short_title}"]
+    output.append(f"**Full Title:** {std.title}")
+    output.append(f"**Organization:** {std.organization}")
+    output.append(f"**Version/Year:** {std.year}")
+    output.append(f"**Pages:** ~{std.pages}")
+    output.append("")
+    
+    output.append("## Scope")
+    output.append(std.scope)
+    output.append("")
+    
+    output.append("## Description")
+    output.append(std.description)
+    output.append("")
+    
+    output.append("## Sections")
+    for sec, desc in std.sections.items():
+        output.append(f"- **{sec}:** {desc}")
+    output.append("")
+    
+    # Annexes
+    if std.annexes:
+        output.append("## Annexes")
+        for annex_id, annex_data in std.annexes.items():
+            status = "(normative)" if annex_data['normative'] else "(informative)"
+            related = annex_data.get('related_sections', [])
+            line = f"- **{annex_id}** {status}: {annex_data['description']}"
+            if related:
+                line += f" [relates to: {', '.join(related)}]"
+            output.append(line)
+        output.append("")
+    
+    # Key Tables
+    if std.key_tables:
+        output.append("## Key Tables")
+        for table_id, table_data in std.key_tables.items():
+            location = table_data.get('location', '')
+            related = table_data.get('related_sections', [])
+            if location:
+                line = f"- **{table_id}** (Section {location}): {table_data['description']}"
+            else:
+                line = f"- **{table_id}:** {table_data['description']}"
+            if related:
+                line += f" [also: {', '.join(related)}]"
+            output.append(line)
+        output.append("")
+    
+    # Key Figures
+    if std.key_figures:
+        output.append("## Key Figures")
+        for figure_id, figure_data in std.key_figures.items():
+            location = figure_data.get('location', '')
+            related = figure_data.get('related_sections', [])
+            if location:
+                line = f"- **{figure_id}** (Section {location}): {figure_data['description']}"
+            else:
+                line = f"- **{figure_id}:** {figure_data['description']}"
+            if related:
+                line += f" [also: {', '.join(related)}]"
+            output.append(line)
+        output.append("")
+    
+    # Key Terms
+    if std.key_terms:
+        output.append("## Key Defined Terms")
+        terms_display = std.key_terms[:15]
+        output.append(", ".join(terms_display))
+        if len(std.key_terms) > 15:
+            output.append(f"... and {len(std.key_terms) - 15} more terms")
+        output.append("")
+    
+    output.append("## Key Topics (Searchable)")
+    topics = std.key_topics
+    for i in range(0, len(topics), 4):
+        output.append("- " + ", ".join(topics[i:i+4]))
+    output.append("")
+    
+    output.append("## Related Standards")
+    for rel in std.related_standards:
+        rel_id = rel['id']
+        relationship = rel.get('relationship', 'related')
+        description = rel.get('description', '')
+        output.append(f"- **{rel_id}** ({relationship})")
+        if description:
+            output.append(f"  {description}")
+    output.append("")
+    
+    # Notes
+    if std.notes:
+        output.append("## Notes")
+        output.append(std.notes)
+        output.append("")
+    
+    return "\n".join(output)
+
+
 async def handle_list_available_standards(arguments: dict) -> str:
     """List all available standards."""
     if not library.standards:
         return "No standards in library. Add PDFs to the data/pdfs directory and update the index."
     
     output = ["# Available Regulatory Standards\n"]
+    pdf_paths = library.pdf_paths()
     
-    for std_id, std in sorted(library.standards.items()):
+    for std_id, std in library.sorted_standards():
         output.append(f"## {std.short_title}")
         output.append(f"**ID:** `{std_id}`")
         output.append(f"**Title:** {std.title}")
@@ -1237,7 +1468,7 @@ async def handle_list_available_standards(arguments: dict) -> str:
         output.append(f"\n{std.description}\n")
         
         # Check if PDF exists
-        pdf_path = library.get_pdf_path(std_id)
+        pdf_path = pdf_paths[std_id]
         if pdf_path:
             output.append(f"📄 PDF available: `{std.filename}`\n")
         else:
@@ -1246,7 +1477,7 @@ async def handle_list_available_standards(arguments: dict) -> str:
         output.append("---\n")
     
     # Show cross-reference stats
-    unique_topics = len(set(xref.topic for xref in library.cross_references.values()))
+    unique_topics = len(library.cross_references)  # One entry per topic; aliases are indexed separately
     if unique_topics > 0:
         output.append(f"\n📚 **Cross-reference index:** {unique_topics} topics indexed for quick lookup")
         output.append("Use `lookup_topic` for fastest access to specific topics.")
@@ -1254,6 +1485,7 @@ async def handle_list_available_standards(arguments: dict) -> str:
     return "\n".join(output)
 
 
+@_memoize_output
 async def handle_lookup_topic(arguments: dict) -> str:
     """Look up a topic in the cross-reference index."""
     topic = arguments["topic"]
@@ -1303,6 +1535,7 @@ risk management, EMC, biocompatibility, essential performance, applied parts"""
     return "\n".join(output)
 
 
+@_memoize_output
 async def handle_find_relevant_standards(arguments: dict) -> str:
     """Find standards relevant to a query."""
     query = arguments["query"]
@@ -1321,6 +1554,7 @@ and their descriptions - you can then determine which is most relevant based on
 understanding of the topic."""
     
     output = [f"# Standards Relevant to: \"{query}\"\n"]
+    query_lower = query.lower()
     
     for i, (std, score) in enumerate(results, 1):
         output.append(f"## {i}. {std.short_title} (relevance: {score:.1f})")
@@ -1328,15 +1562,15 @@ understanding of the topic."""
         output.append(f"\n{std.description}\n")
         
         # Show which topics matched
-        matching_topics = [t for t in std.key_topics if query.lower() in t.lower() or t.lower() in query.lower()]
+        matching_topics = std.matching_topics(query_lower)
         if matching_topics:
             output.append(f"**Matching topics:** {', '.join(matching_topics[:5])}\n")
         
         # Show relevant sections
-        matching_sections = {k: v for k, v in std.sections.items() if query.lower() in v.lower()}
+        matching_sections = std.sections_containing(query_lower)
         if matching_sections:
             output.append("**Relevant sections:**")
-            for sec, desc in list(matching_sections.items())[:3]:
+            for sec, desc in matching_sections[:3]:
                 output.append(f"- Section {sec}: {desc}")
             output.append("")
         
@@ -1355,50 +1589,12 @@ async def handle_get_all_standards_semantic(arguments: dict) -> str:
     output = ["# All Available Standards\n"]
     output.append("Review these descriptions to find which standard(s) are most relevant to your query.\n")
     output.append("---\n")
+    pdf_paths = library.pdf_paths()
     
-    for std_id, std in sorted(library.standards.items()):
-        output.append(f"## {std.short_title} (`{std.id}`)")
-        output.append(f"\n**Title:** {std.title}\n")
-        output.append(f"**Scope:** {std.scope}\n")
-        output.append(f"**Description:** {std.description}\n")
-        
-        output.append("**Sections:**")
-        for sec, desc in std.sections.items():
-            output.append(f"- {sec}: {desc}")
-        
-        # Show annexes with related sections
-        if std.annexes:
-            output.append("\n**Annexes:**")
-            for annex_id, annex_data in std.annexes.items():
-                status = "normative" if annex_data['normative'] else "informative"
-                related = annex_data.get('related_sections', [])
-                line = f"- {annex_id} ({status}): {annex_data['description']}"
-                if related:
-                    line += f" [relates to: {', '.join(related)}]"
-                output.append(line)
+    for std_id, std in library.sorted_standards():
+        output.append(_render_cached("semantic", std, _render_semantic))
         
-        # Show key tables with locations
-        if std.key_tables:
-            output.append("\n**Key Tables:**")
-            for table_id, table_data in std.key_tables.items():
-                location = table_data.get('location', '')
-                related = table_data.get('related_sections', [])
-                if location:
-                    line = f"- {table_id} (Section {location}): {table_data['description']}"
-                else:
-                    line = f"- {table_id}: {table_data['description']}"
-                if related:
-                    line += f" [also: {', '.join(related)}]"
-                output.append(line)
-        
-        output.append(f"\n**Key topics:** {', '.join(std.key_topics)}")
-        
-        if std.key_terms:
-            output.append(f"\n**Defined terms:** {', '.join(std.key_terms[:10])}")
-            if len(std.key_terms) > 10:
-                output.append(f"  ...and {len(std.key_terms) - 10} more")
-        
-        pdf_path = library.get_pdf_path(std_id)
+        pdf_path = pdf_paths[std_id]
         output.append(f"\n**PDF:** {'✓ Available' if pdf_path else '✗ Missing'}")
         output.append("\n---\n")
     
@@ -1416,98 +1612,7 @@ async def handle_get_standard_overview(arguments: dict) -> str:
         available = ", ".join(library.standards.keys())
         return f"Standard '{standard_id}' not found. Available standards: {available}"
     
-    output = [f"# {std.short_title}"]
-    output.append(f"**Full Title:** {std.title}")
-    output.append(f"**Organization:** {std.organization}")
-    output.append(f"**Version/Year:** {std.year}")
-    output.append(f"**Pages:** ~{std.pages}")
-    output.append("")
-    
-    output.append("## Scope")
-    output.append(std.scope)
-    output.append("")
-    
-    output.append("## Description")
-    output.append(std.description)
-    output.append("")
-    
-    output.append("## Sections")
-    for sec, desc in std.sections.items():
-        output.append(f"- **{sec}:** {desc}")
-    output.append("")
-    
-    # Annexes
-    if std.annexes:
-        output.append("## Annexes")
-        for annex_id, annex_data in std.annexes.items():
-            status = "(normative)" if annex_data['normative'] else "(informative)"
-            related = annex_data.get('related_sections', [])
-            line = f"- **{annex_id}** {status}: {annex_data['description']}"
-            if related:
-                line += f" [relates to: {', '.join(related)}]"
-            output.append(line)
-        output.append("")
-    
-    # Key Tables
-    if std.key_tables:
-        output.append("## Key Tables")
-        for table_id, table_data in std.key_tables.items():
-            location = table_data.get('location', '')
-            related = table_data.get('related_sections', [])
-            if location:
-                line = f"- **{table_id}** (Section {location}): {table_data['description']}"
-            else:
-                line = f"- **{table_id}:** {table_data['description']}"
-            if related:
-                line += f" [also: {', '.join(related)}]"
-            output.append(line)
-        output.append("")
-    
-    # Key Figures
-    if std.key_figures:
-        output.append("## Key Figures")
-        for figure_id, figure_data in std.key_figures.items():
-            location = figure_data.get('location', '')
-            related = figure_data.get('related_sections', [])
-            if location:
-                line = f"- **{figure_id}** (Section {location}): {figure_data['description']}"
-            else:
-                line = f"- **{figure_id}:** {figure_data['description']}"
-            if related:
-                line += f" [also: {', '.join(related)}]"
-            output.append(line)
-        output.append("")
-    
-    # Key Terms
-    if std.key_terms:
-        output.append("## Key Defined Terms")
-        terms_display = std.key_terms[:15]
-        output.append(", ".join(terms_display))
-        if len(std.key_terms) > 15:
-            output.append(f"... and {len(std.key_terms) - 15} more terms")
-        output.append("")
-    
-    output.append("## Key Topics (Searchable)")
-    topics = std.key_topics
-    for i in range(0, len(topics), 4):
-        output.append("- " + ", ".join(topics[i:i+4]))
-    output.append("")
-    
-    output.append("## Related Standards")
-    for rel in std.related_standards:
-        rel_id = rel['id']
-        relationship = rel.get('relationship', 'related')
-        description = rel.get('description', '')
-        output.append(f"- **{rel_id}** ({relationship})")
-        if description:
-            output.append(f"  {description}")
-    output.append("")
-    
-    # Notes
-    if std.notes:
-        output.append("## Notes")
-        output.append(std.notes)
-        output.append("")
+    output = [_render_cached("overview", std, _render_overview)]
     
     # PDF status
     pdf_path = library.get_pdf_path(standard_id)
@@ -1519,6 +1624,7 @@ async def handle_get_standard_overview(arguments: dict) -> str:
     return "\n".join(output)
 
 
+@_memoize_output
 async def handle_find_section(arguments: dict) -> str:
     """Find relevant section in a standard."""
     standard_id = arguments["standard_id"]
@@ -1531,19 +1637,17 @@ async def handle_find_section(arguments: dict) -> str:
     topic_lower = topic.lower()
     
     # Search sections
-    matching_sections = []
-    for sec, desc in std.sections.items():
-        if topic_lower in desc.lower():
-            matching_sections.append((sec, desc, "title match"))
+    matching_sections = [(sec, desc, "title match") for sec, desc in std.sections_containing(topic_lower)]
     
     # Search key topics to infer sections
-    for key_topic in std.key_topics:
-        if topic_lower in key_topic.lower() or key_topic.lower() in topic_lower:
-            # Try to map topic to section (heuristic)
-            for sec, desc in std.sections.items():
-                if key_topic.lower() in desc.lower():
-                    if (sec, desc, "topic match") not in matching_sections:
-                        matching_sections.append((sec, desc, "topic match"))
+    topics_lc = std.detail_index().topics_lc
+    topic_matched = set()
+    for topic_idx in std.matching_topic_indexes(topic_lower):
+        # Try to map topic to section (heuristic)
+        for sec, desc in std.sections_containing(topics_lc[topic_idx]):
+            if sec not in topic_matched:
+                topic_matched.add(sec)
+                matching_sections.append((sec, desc, "topic match"))
     
     if not matching_sections:
         output = [f"# Section Search: \"{topic}\" in {std.short_title}\n"]
@@ -1565,6 +1669,7 @@ async def handle_find_section(arguments: dict) -> str:
     return "\n".join(output)
 
 
+@_memoize_output
 async def handle_find_table(arguments: dict) -> str:
     """Find tables in a standard that match a topic or section."""
     standard_id = arguments["standard_id"]
@@ -1584,40 +1689,19 @@ async def handle_find_table(arguments: dict) -> str:
     
     # Search key_tables
     matching_tables = []
-    for table_id, table_data in std.key_tables.items():
-        desc = table_data['description']
+    for table_id, table_data, match_type in std.detail_index().tables.find(topic_lower):
         location = table_data.get('location', '')
         related = table_data.get('related_sections', [])
-        
-        # Check if query matches description
-        if topic_lower in desc.lower():
-            matching_tables.append((table_id, desc, location, related, "description match"))
-            continue
-        
-        # Check if query matches location or related sections (for section-based searches)
-        section_match = False
-        if location:
-            if topic_lower == location.lower() or topic_lower.startswith(location.lower() + ".") or location.lower().startswith(topic_lower + "."):
-                section_match = True
-        for rel_sec in related:
-            if topic_lower == rel_sec.lower() or topic_lower.startswith(rel_sec.lower() + ".") or rel_sec.lower().startswith(topic_lower + "."):
-                section_match = True
-                break
-        
-        if section_match:
-            matching_tables.append((table_id, desc, location, related, "section match"))
-            continue
-        
-        # Check individual words in description
-        for word in topic_lower.split():
-            if len(word) > 3 and word in desc.lower():
-                matching_tables.append((table_id, desc, location, related, "word match"))
-                break
+        matching_tables.append((table_id, table_data['description'], location, related, match_type))
     
-    # Also search sections for table references
-    for sec, desc in std.sections.items():
-        if topic_lower in desc.lower() and "table" in desc.lower():
-            matching_tables.append((f"See Section {sec}", desc, sec, [], "section reference"))
+    # Also search sections for table references (table IDs are unique already)
+    seen = {match[0] for match in matching_tables}
+    table_sections = std.detail_index().table_sections
+    for sec, desc in std.sections_containing(topic_lower):
+        ref_id = f"See Section {sec}"
+        if sec in table_sections and ref_id not in seen:
+            seen.add(ref_id)
+            matching_tables.append((ref_id, desc, sec, [], "section reference"))
     
     if not matching_tables:
         output = [f"# Table Search: \"{topic}\" in {std.short_title}\n"]
@@ -1638,16 +1722,8 @@ async def handle_find_table(arguments: dict) -> str:
     
     output = [f"# Tables for \"{topic}\" in {std.short_title}\n"]
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_matches = []
-    for item in matching_tables:
-        if item[0] not in seen:
-            seen.add(item[0])
-            unique_matches.append(item)
-    
     output.append("**Likely relevant tables:**\n")
-    for table_id, desc, location, related, match_type in unique_matches[:5]:
+    for table_id, desc, location, related, match_type in matching_tables[:5]:
         if location:
             line = f"- **{table_id}** (Section {location}): {desc}"
         else:
@@ -1661,6 +1737,7 @@ async def handle_find_table(arguments: dict) -> str:
     return "\n".join(output)
 
 
+@_memoize_output
 async def handle_find_figure(arguments: dict) -> str:
     """Find figures in a standard that match a topic or section."""
     standard_id = arguments["standard_id"]
@@ -1680,35 +1757,10 @@ async def handle_find_figure(arguments: dict) -> str:
     
     # Search key_figures
     matching_figures = []
-    for figure_id, figure_data in std.key_figures.items():
-        desc = figure_data['description']
+    for figure_id, figure_data, match_type in std.detail_index().figures.find(topic_lower):
         location = figure_data.get('location', '')
         related = figure_data.get('related_sections', [])
-        
-        # Check if query matches description
-        if topic_lower in desc.lower():
-            matching_figures.append((figure_id, desc, location, related, "description match"))
-            continue
-        
-        # Check if query matches location or related sections (for section-based searches)
-        section_match = False
-        if location:
-            if topic_lower == location.lower() or topic_lower.startswith(location.lower() + ".") or location.lower().startswith(topic_lower + "."):
-                section_match = True
-        for rel_sec in related:
-            if topic_lower == rel_sec.lower() or topic_lower.startswith(rel_sec.lower() + ".") or rel_sec.lower().startswith(topic_lower + "."):
-                section_match = True
-                break
-        
-        if section_match:
-            matching_figures.append((figure_id, desc, location, related, "section match"))
-            continue
-        
-        # Check individual words in description
-        for word in topic_lower.split():
-            if len(word) > 3 and word in desc.lower():
-                matching_figures.append((figure_id, desc, location, related, "word match"))
-                break
+        matching_figures.append((figure_id, figure_data['description'], location, related, match_type))
     
     if not matching_figures:
         output = [f"# Figure Search: \"{topic}\" in {std.short_title}\n"]
@@ -1729,16 +1781,8 @@ async def handle_find_figure(arguments: dict) -> str:
     
     output = [f"# Figures for \"{topic}\" in {std.short_title}\n"]
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_matches = []
-    for item in matching_figures:
-        if item[0] not in seen:
-            seen.add(item[0])
-            unique_matches.append(item)
-    
     output.append("**Likely relevant figures:**\n")
-    for figure_id, desc, location, related, match_type in unique_matches[:5]:
+    for figure_id, desc, location, related, match_type in matching_figures[:5]:
         if location:
             line = f"- **{figure_id}** (Section {location}): {desc}"
         else:
@@ -1752,6 +1796,7 @@ async def handle_find_figure(arguments: dict) -> str:
     return "\n".join(output)
 
 
+@_memoize_output
 async def handle_find_annex(arguments: dict) -> str:
     """Find annexes in a standard that relate to a section or topic."""
     standard_id = arguments["standard_id"]
@@ -1769,33 +1814,27 @@ async def handle_find_annex(arguments: dict) -> str:
         output.append("The standard may still contain annexes - use `get_pdf_for_reading` to check the document directly.")
         return "\n".join(output)
     
-    matching_annexes = []
+    annex_index = std.detail_index().annexes
+    desc_hits = annex_index.description_hits(query_lower)
+    # Section references, or a "general" annex whose description matches
+    section_hits = annex_index.section_hits(query_lower) | (desc_hits & annex_index.general_items)
     
-    for annex_id, annex_data in std.annexes.items():
-        desc = annex_data['description']
+    # Separate normative and informative while collecting matches
+    normative_annexes, informative_annexes = [], []
+    for idx in sorted(desc_hits | section_hits):
+        annex_id, annex_data = annex_index.items[idx]
         normative = annex_data['normative']
+        if normative is True:
+            bucket = normative_annexes
+        elif normative is False:
+            bucket = informative_annexes
+        else:
+            continue
+        match_type = "section" if idx in section_hits else "topic"
         related_sections = annex_data.get('related_sections', [])
-        
-        # Check if the query matches a related section
-        section_match = False
-        for rel_sec in related_sections:
-            # Match "8" to "8", "8.7", "8.7.3" etc.
-            if query_lower == rel_sec.lower() or query_lower.startswith(rel_sec.lower() + ".") or rel_sec.lower().startswith(query_lower + "."):
-                section_match = True
-                break
-            # Also check if rel_sec is "general" and query matches description
-            if rel_sec.lower() == "general" and query_lower in desc.lower():
-                section_match = True
-                break
-        
-        # Check if query matches description
-        desc_match = query_lower in desc.lower()
-        
-        if section_match or desc_match:
-            match_type = "section" if section_match else "topic"
-            matching_annexes.append((annex_id, desc, normative, related_sections, match_type))
+        bucket.append((annex_id, annex_data['description'], related_sections, match_type))
     
-    if not matching_annexes:
+    if not (desc_hits or section_hits):
         output = [f"# Annex Search: \"{section_or_topic}\" in {std.short_title}\n"]
         output.append(f"No annexes directly related to '{section_or_topic}' found.\n")
         output.append("**Available annexes in this standard:**")
@@ -1810,13 +1849,9 @@ async def handle_find_annex(arguments: dict) -> str:
     
     output = [f"# Annexes for \"{section_or_topic}\" in {std.short_title}\n"]
     
-    # Separate normative and informative
-    normative_annexes = [a for a in matching_annexes if a[2] is True]
-    informative_annexes = [a for a in matching_annexes if a[2] is False]
-    
     if normative_annexes:
         output.append("**Normative Annexes (required for compliance):**\n")
-        for annex_id, desc, _, related, match_type in normative_annexes:
+        for annex_id, desc, related, match_type in normative_annexes:
             line = f"- **{annex_id}**: {desc}"
             if related:
                 line += f"\n  Related sections: {', '.join(related)}"
@@ -1825,7 +1860,7 @@ async def handle_find_annex(arguments: dict) -> str:
     
     if informative_annexes:
         output.append("**Informative Annexes (guidance/rationale):**\n")
-        for annex_id, desc, _, related, match_type in informative_annexes:
+        for annex_id, desc, related, match_type in informative_annexes:
             line = f"- **{annex_id}**: {desc}"
             if related:
                 line += f"\n  Related sections: {', '.join(related)}"
@@ -1851,11 +1886,17 @@ async def handle_get_related_standards(arguments: dict) -> str:
         output.append("No related standards listed.")
         return "\n".join(output)
     
-    for rel_id in std.related_standards:
+    for rel in std.related_standards:
+        rel_id = rel['id']
+        relationship = rel.get('relationship', 'related')
+        description = rel.get('description', '')
         rel_std = library.standards.get(rel_id)
         if rel_std:
             output.append(f"## {rel_std.short_title}")
             output.append(f"**ID:** `{rel_id}`")
+            output.append(f"**Relationship:** {relationship}")
+            if description:
+                output.append(f"**Relevance:** {description}")
             output.append(f"**Title:** {rel_std.title}")
             output.append(f"\n{rel_std.description}\n")
             
@@ -1865,12 +1906,31 @@ async def handle_get_related_standards(arguments: dict) -> str:
             output.append("---\n")
         else:
             output.append(f"## {rel_id}")
+            output.append(f"**Relationship:** {relationship}")
+            if description:
+                output.append(f"**Relevance:** {description}")
             output.append("(Not in library - you may need to obtain this standard)\n")
             output.append("---\n")
     
     return "\n".join(output)
 
 
+def _prefetch_pdf(pdf_path: Path):
+    """Ask the OS to start reading a PDF into the page cache ahead of the client fetching it."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(pdf_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 async def handle_get_pdf_for_reading(arguments: dict) -> str:
     """Get PDF path for reading."""
     standard_id = arguments["standard_id"]
@@ -1884,6 +1944,7 @@ async def handle_get_pdf_for_reading(arguments: dict) -> str:
     output = [f"# PDF Access: {std.short_title}\n"]
     
     if pdf_path:
+        _prefetch_pdf(pdf_path)
         output.append(f"**File:** `{pdf_path}`")
         output.append(f"**Size:** ~{std.pages} pages")
         output.append(f"\n**Full path:** `{pdf_path.absolute()}`")
@@ -1911,8 +1972,8 @@ async def handle_get_pdf_for_reading(arguments: dict) -> str:
     return "\n".join(output)
 
 
-# Tool handler dispatcher
-TOOL_HANDLERS = {
+# Tool handler dispatcher (read-only; call_tool resolves a tool with a single .get)
+TOOL_HANDLERS = MappingProxyType({
     "list_available_standards": handle_list_available_standards,
     "lookup_topic": handle_lookup_topic,
     "find_relevant_standards": handle_find_relevant_standards,
@@ -1924,7 +1985,7 @@ TOOL_HANDLERS = {
     "find_annex": handle_find_annex,
     "get_related_standards": handle_get_related_standards,
     "get_pdf_for_reading": handle_get_pdf_for_reading,
-}
+})
 
 
 # =============================================================================
@@ -1934,19 +1995,117 @@ TOOL_HANDLERS = {
 @server.list_resources()
 async def list_resources() -> ListResourcesResult:
     """List PDFs as resources."""
-    resources = []
+    # Reuse the last listing until the library changes or the PDF directory's
+    # entries change. PDFs added or removed in nested subdirectories don't touch
+    # the directory's mtime; call library.invalidate_pdf_listing() after those.
+    lib = library
+    try:
+        dir_version = os.stat(lib.pdf_directory).st_mtime_ns
+    except OSError:
+        dir_version = None
+    key = (lib.pdf_directory, dir_version)
+    cached = lib._resources
+    if cached is not None and cached[0] == key:
+        return cached[1]
     
-    for std_id, std in library.standards.items():
-        pdf_path = library.get_pdf_path(std_id)
-        if pdf_path:
+    resources = []
+    pdf_paths = lib.pdf_paths()
+    for std_id, std in lib.standards.items():
+        if pdf_paths[std_id] is not None:
             resources.append(Resource(
                 uri=f"standards://{std_id}/pdf",
                 name=f"{std.short_title} (PDF)",
                 description=std.title,
                 mimeType="application/pdf"
             ))
-    
-    return ListResourcesResult(resources=resources)
+            if zstandard is not None:
+                resources.append(Resource(
+                    uri=f"standards://{std_id}/pdf.zst",
+                    name=f"{std.short_title} (PDF, zstd)",
+                    description=std.title,
+                    mimeType="application/zstd"
+                ))
+    
+    result = ListResourcesResult(resources=resources)
+    lib._resources = (key, result)
+    return result
+
+
+def _b64_text(data) -> str:
+    """Base64-encode a bytes-like object (such as an mmap) in one call, as ASCII text."""
+    b64encode = pybase64.b64encode if pybase64 is not None else base64.b64encode
+    return b64encode(data).decode("ascii")
+
+
+def _encode_pdf(pdf_path: Path, compress: bool = False) -> str:
+    """Base64-encode a memory-mapped PDF, zstd-compressing it first if asked."""
+    with open(pdf_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap rejects empty files
+            return _b64_text(zstandard.ZstdCompressor(level=3).compress(b"") if compress else b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if compress:
+                return _b64_text(zstandard.ZstdCompressor(level=3).compress(mm))
+            return _b64_text(mm)
+
+
+def _hash_pdf(pdf_path: Path) -> str:
+    """blake2b digest of a PDF's contents, used as its ETag."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:  # mmap rejects empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest.update(mm)
+    return digest.hexdigest()
+
+
+# Resource URI, with an optional ETag from an earlier read: standards://<id>/pdf[.zst][?etag=<etag>]
+_RESOURCE_URI_RE = re.compile(r"(standards://([^/?]+)/pdf(\.zst)?)(?:\?etag=([0-9a-f]+))?")
+
+_pdf_result_cache = LRUCache(4)  # (URI, path, mtime_ns, size) -> result; each entry is ~1.33x its PDF
+_pdf_etags = LRUCache(64)  # (path, mtime_ns, size) -> ETag
+
+
+async def _pdf_resource(uri: str, pdf_path: Path, st: os.stat_result, compress: bool = False,
+                        client_etag: Optional[str] = None) -> ReadResourceResult:
+    """Blob result for a PDF resource, reused until the file on disk changes.
+    
+    The result carries the PDF's ETag in _meta; a client that sends back the
+    current ETag gets a short "not modified" result instead of the blob.
+    """
+    file_key = (str(pdf_path), st.st_mtime_ns, st.st_size)
+    etag = _pdf_etags.get(file_key)
+    if etag is None:
+        etag = await asyncio.to_thread(_hash_pdf, pdf_path)
+        _pdf_etags.put(file_key, etag)
+    
+    if client_etag == etag:
+        return ReadResourceResult(contents=[
+            TextResourceContents(
+                uri=uri,
+                mimeType="text/plain",
+                text=f"Not modified: {uri}",
+                _meta={"etag": etag}
+            )
+        ])
+    
+    key = (uri, *file_key)
+    result = _pdf_result_cache.get(key)
+    if result is None:
+        # Read and base64 encode the PDF off the event loop; the file is closed before the models are built
+        content = await asyncio.to_thread(_encode_pdf, pdf_path, compress)
+        result = ReadResourceResult(
+            contents=[BlobResourceContents(
+                uri=uri,
+                mimeType="application/zstd" if compress else "application/pdf",
+                blob=content,
+                _meta={"etag": etag}
+            )]
+        )
+        _pdf_result_cache.put(key, result)
+    return result
 
 
 @server.read_resource()
@@ -1954,23 +2113,34 @@ async def read_resource(request: ReadResourceRequest) -> ReadResourceResult:
     """Read a PDF resource."""
     uri = request.params.uri
     
-    # Parse URI: standards://IEC_60601-1/pdf
-    if uri.startswith("standards://") and uri.endswith("/pdf"):
-        std_id = uri[12:-4]  # Extract standard ID
+    # Parse URI: standards://IEC_60601-1/pdf, or standards://IEC_60601-1/pdf.zst for zstd
+    uri_match = _RESOURCE_URI_RE.fullmatch(str(uri))
+    if uri_match:
+        resource_uri, std_id, zst, client_etag = uri_match.groups()
+        compress = zst is not None
         
-        pdf_path = library.get_pdf_path(std_id)
-        if pdf_path and pdf_path.exists():
-            # Read and base64 encode the PDF
-            with open(pdf_path, "rb") as f:
-                content = base64.b64encode(f.read()).decode("utf-8")
-            
-            return ReadResourceResult(
-                contents=[BlobResourceContents(
-                    uri=uri,
-                    mimeType="application/pdf",
-                    blob=content
-                )]
-            )
+        # One stat answers both "does it exist" and "which version is cached"
+        std = library.standards.get(std_id)
+        st = None
+        if std and not (compress and zstandard is None):
+            pdf_path = Path(library.pdf_directory) / std.filename
+            try:
+                st = pdf_path.stat()
+            except OSError:
+                pass
+        if st is not None:
+            if compress:
+                return await _pdf_resource(resource_uri, pdf_path, st, compress=True, client_etag=client_etag)
+            if get_resource_mode() == "local":
+                # Same-machine clients can open the file directly, skipping the base64 payload
+                return ReadResourceResult(contents=[
+                    TextResourceContents(
+                        uri=resource_uri,
+                        mimeType="text/uri-list",
+                        text=pdf_path.resolve().as_uri()
+                    )
+                ])
+            return await _pdf_resource(resource_uri, pdf_path, st, client_etag=client_etag)
     
     return ReadResourceResult(contents=[
         TextResourceContents(
@@ -1988,7 +2158,7 @@ async def read_resource(request: ReadResourceRequest) -> ReadResourceResult:
 @server.list_tools()
 async def list_tools() -> ListToolsResult:
     """Return list of available tools."""
-    return ListToolsResult(tools=TOOLS)
+    return get_list_tools_result()
 
 
 @server.call_tool()
@@ -1997,7 +2167,7 @@ async def call_tool(request: CallToolRequest) -> CallToolResult:
     tool_name = request.params.name
     arguments = request.params.arguments or {}
     
-    logger.info(f"Tool call: {tool_name} with args: {arguments}")
+    logger.info("Tool call: %s with args: %s", tool_name, arguments)
     
     handler = TOOL_HANDLERS.get(tool_name)
     if not handler:
@@ -2011,7 +2181,7 @@ async def call_tool(request: CallToolRequest) -> CallToolResult:
             content=[TextContent(type="text", text=result)]
         )
     except Exception as e:
-        logger.error(f"Tool error: {e}", exc_info=True)
+        logger.error("Tool error: %s", e, exc_info=True)
         return CallToolResult(
             content=[TextContent(type="text", text=f"Error: {str(e)}")]
         )